@@ -544,6 +544,8 @@ def _strip_ansi_fallback(text: str) -> str:
 if _native_available:
 	def _strip_ansi(text: str) -> str:
 		"""Strip ANSI escape sequences using the native Rust implementation."""
+		if '\x1b' not in text:
+			return text
 		try:
 			return _native_strip_ansi(text)
 		except Exception:
@@ -674,6 +676,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	# output responsive without masking navigation feedback.
 	_BLANK_AFTER_TYPING_GRACE: float = 0.3
 
+	# Delays (ms) for the re-feeds scheduled after a suppressed blank, so the
+	# character is announced once the terminal finishes redrawing the line.
+	_BLANK_REFEED_DELAYS: tuple = (50, 150)
+
 	# Class-level gesture map: ALL gestures are bound so they appear in
 	# NVDA's Input Gestures dialog under the Terminal Access category.
 	# getScript() returns None for terminal-specific gestures outside
@@ -730,7 +736,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		# Cached punctuation set — avoids dict lookup on every typed character.
 		# Invalidated when the punctuation level changes.
 		self._cachedPunctLevel: int = -1
-		self._cachedPunctSet: set | None = None
+		self._cachedPunctSet: frozenset[str] | None = None
 
 		# Highlight tracking state
 		self._lastHighlightedText = None
@@ -1570,8 +1576,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if typing_induced and (not char or char in ('\r', '\n')):
 			if not _retry:
 				try:
-					wx.CallLater(50, self._announceStandardCursor, obj, True)
-					wx.CallLater(150, self._announceStandardCursor, obj, True)
+					for delay in self._BLANK_REFEED_DELAYS:
+						wx.CallLater(delay, self._announceStandardCursor, obj, True)
 				except (RuntimeError, AttributeError):
 					pass
 			return
@@ -2906,7 +2912,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		# Refresh cached set only when the level has changed.
 		if level != self._cachedPunctLevel:
 			self._cachedPunctLevel = level
-			self._cachedPunctSet = PUNCTUATION_SETS.get(level, set())
+			self._cachedPunctSet = PUNCTUATION_SETS.get(level, frozenset())
 
 		return char in self._cachedPunctSet
 
@@ -9,6 +9,9 @@ import re
 
 from lib.caching import TextDiffer
 
+# Boundary between a lowercase and an uppercase letter in a camelCase name.
+_CAMEL_BOUNDARY: re.Pattern[str] = re.compile(r'(?<=[a-z])(?=[A-Z])')
+
 
 def gesture_label(gesture: str, script_name: str) -> str:
 	"""Format a gesture and script name into a human-readable label.
@@ -27,7 +30,7 @@ def gesture_label(gesture: str, script_name: str) -> str:
 		else:
 			formatted.append(p.upper())
 	key_display = "+".join(formatted)
-	label = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', script_name)
+	label = _CAMEL_BOUNDARY.sub(' ', script_name)
 	return f"{key_display} \u2014 {label.title()}"
 
 # Text processing
@@ -11,10 +11,12 @@ _TRAILING_SPACES_RE: re.Pattern[str] = re.compile(r' +$', re.MULTILINE)
 
 class PositionCache:
 	"""
-	Cache for terminal position calculations with timestamp-based invalidation.
+	Cache for terminal position calculations with deadline-based invalidation.
 
-	Stores bookmark→(row, col, timestamp) mappings to avoid repeated O(n) calculations.
-	Cache entries expire after CACHE_TIMEOUT_MS milliseconds.
+	Stores bookmark→(row, col, deadline) mappings to avoid repeated O(n) calculations.
+	Cache entries expire CACHE_TIMEOUT_NS nanoseconds after they are stored.
+	Deadlines use time.monotonic_ns(), so wall-clock adjustments cannot
+	extend or cut short an entry's lifetime.
 
 	Example usage:
 		>>> cache = PositionCache()
@@ -30,11 +32,13 @@ class PositionCache:
 		>>> if cached_pos:
 		>>>     row, col = cached_pos  # No expensive recalculation needed
 		>>>
-		>>> # After CACHE_TIMEOUT_MS milliseconds
+		>>> # After CACHE_TIMEOUT_NS nanoseconds
 		>>> cached_pos = cache.get(bookmark)  # Returns None (expired)
 
 	Thread Safety:
-		All operations are thread-safe using internal locking.
+		All operations are thread-safe.  Mutations take an internal lock;
+		get() looks up without it and locks only to move a hit to the end
+		or drop an expired entry, so misses never wait on writers.
 
 	Performance:
 		- get(): O(1) average case
@@ -42,14 +46,39 @@ class PositionCache:
 		- Space complexity: O(min(n, MAX_CACHE_SIZE)) where n = unique bookmarks
 	"""
 
-	CACHE_TIMEOUT_S: float = 1.0  # Seconds (avoids per-call ms conversion)
+	CACHE_TIMEOUT_NS: int = 1_000_000_000  # 1 second, added to monotonic_ns() on set
 	MAX_CACHE_SIZE = 100  # Maximum number of cached positions
 
 	def __init__(self) -> None:
 		"""Initialize an empty position cache."""
-		self._cache: OrderedDict[str, tuple[int, int, float]] = OrderedDict()
+		self._cache: OrderedDict[Any, tuple[int, int, int]] = OrderedDict()
 		self._lock: threading.Lock = threading.Lock()
 
+	@staticmethod
+	def _key(bookmark: Any) -> Any:
+		"""
+		Return a value-based cache key for a bookmark.
+
+		Bookmarks with value equality and a hash key themselves.  NVDA's
+		Offsets bookmarks define __eq__ without __hash__, so they key on
+		their offset pair.  Anything else, including identity-hashed COM
+		bookmarks, falls back to str().  Identity is never used: each
+		textInfo.bookmark read returns a new object.
+
+		Args:
+			bookmark: TextInfo bookmark object
+
+		Returns:
+			A hashable key equal for equal bookmarks
+		"""
+		cls = type(bookmark)
+		if cls.__hash__ is not None and cls.__eq__ is not object.__eq__:
+			return bookmark
+		try:
+			return (bookmark.startOffset, bookmark.endOffset)
+		except AttributeError:
+			return str(bookmark)
+
 	def get(self, bookmark: Any) -> tuple[int, int] | None:
 		"""
 		Retrieve cached position for a bookmark if valid.
@@ -63,22 +92,31 @@ class PositionCache:
 		Returns:
 			tuple: (row, col) if cache hit and not expired, None otherwise
 		"""
-		with self._lock:
-			key = str(bookmark)
-			entry = self._cache.get(key)
-			if entry is not None:
-				row, col, timestamp = entry
-				if (time.time() - timestamp) < self.CACHE_TIMEOUT_S:
-					# LRU: move to end so this entry is evicted last
+		# Lock-free lookup; reordering or removing an entry takes the lock,
+		# since a concurrent set() or eviction could otherwise mutate the
+		# OrderedDict mid-operation.
+		key = self._key(bookmark)
+		entry = self._cache.get(key)
+		if entry is None:
+			return None
+		row, col, deadline = entry
+		if time.monotonic_ns() < deadline:
+			# LRU: move to end so this entry is evicted last
+			with self._lock:
+				try:
 					self._cache.move_to_end(key)
-					return (row, col)
-				# Expired entry, remove it
+				except KeyError:
+					pass  # Evicted or cleared by another thread meanwhile
+			return (row, col)
+		# Expired entry, remove it unless a writer already replaced it
+		with self._lock:
+			if self._cache.get(key) is entry:
 				del self._cache[key]
 		return None
 
 	def set(self, bookmark: Any, row: int, col: int) -> None:
 		"""
-		Store position in cache with current timestamp.
+		Store position in cache with an expiry deadline.
 
 		Uses LRU eviction: when the cache is full, the least-recently
 		used entry is evicted instead of the oldest by insertion time.
@@ -89,7 +127,7 @@ class PositionCache:
 			col: Column number
 		"""
 		with self._lock:
-			key = str(bookmark)
+			key = self._key(bookmark)
 			# If already present, update and move to end (LRU refresh)
 			if key in self._cache:
 				self._cache.move_to_end(key)
@@ -97,7 +135,7 @@ class PositionCache:
 				# Evict the least-recently used entry (front of OrderedDict)
 				self._cache.popitem(last=False)
 
-			self._cache[key] = (row, col, time.time())
+			self._cache[key] = (row, col, time.monotonic_ns() + self.CACHE_TIMEOUT_NS)
 
 	def clear(self) -> None:
 		"""Clear all cached positions."""
@@ -112,7 +150,7 @@ class PositionCache:
 			bookmark: TextInfo bookmark to invalidate
 		"""
 		with self._lock:
-			key = str(bookmark)
+			key = self._key(bookmark)
 			if key in self._cache:
 				del self._cache[key]
 
@@ -198,8 +236,9 @@ class TextDiffer:
 			return (self.KIND_UNCHANGED, "")
 
 		# Fast append detection: new text is longer and starts with old text.
+		# startswith compares in place instead of slicing a copy of the prefix.
 		old_len = self._last_len
-		if cur_len > old_len and current_text[:old_len] == old:
+		if cur_len > old_len and current_text.startswith(old):
 			appended = current_text[old_len:]
 			self._last_text = current_text
 			self._last_len = cur_len
@@ -207,14 +246,19 @@ class TextDiffer:
 
 		# Last-line overwrite detection: everything before the last newline is
 		# identical, only the trailing content differs (progress bars, spinners).
-		# Skip the expensive rpartition if the lengths differ dramatically.
+		# Equal prefixes put the last newline at the same offset in both texts,
+		# so compare those offsets first and only then the prefix itself.
+		# That comparison slices one copy of the old prefix: str has no
+		# bounded compare against part of another string, and
+		# startswith(old, 0, nl) would test all of old, not old[:nl].
+		# Skip the check if the lengths differ dramatically.
 		if abs(cur_len - old_len) <= 500:
-			old_prefix, old_sep, _old_tail = old.rpartition('\n')
-			new_prefix, new_sep, new_tail = current_text.rpartition('\n')
-			if old_sep and new_sep and old_prefix == new_prefix:
+			nl = old.rfind('\n')
+			if (nl != -1 and current_text.rfind('\n') == nl
+					and current_text.startswith(old[:nl])):
 				self._last_text = current_text
 				self._last_len = cur_len
-				return (self.KIND_LAST_LINE_UPDATED, new_tail)
+				return (self.KIND_LAST_LINE_UPDATED, current_text[nl + 1:])
 
 		# Non-trivial change.
 		self._last_text = current_text
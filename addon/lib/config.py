@@ -46,9 +46,9 @@ PUNCT_ALL = 3
 
 # Punctuation character sets for each level
 PUNCTUATION_SETS = {
-	PUNCT_NONE: set(),  # No punctuation
-	PUNCT_SOME: set('.,?!;:'),  # Basic punctuation
-	PUNCT_MOST: set('.,?!;:@#$%^&*()_+=[]{}\\|<>/'),  # Most punctuation
+	PUNCT_NONE: frozenset(),  # No punctuation
+	PUNCT_SOME: frozenset('.,?!;:'),  # Basic punctuation
+	PUNCT_MOST: frozenset('.,?!;:@#$%^&*()_+=[]{}\\|<>/'),  # Most punctuation
 	PUNCT_ALL: None  # All punctuation (process everything)
 }
 
@@ -89,6 +89,26 @@ confspec = {
 	"summarizationEnabled": "boolean(default=False)",  # Enable offline extractive summarization of terminal output (opt-in)
 }
 
+# (key, default) pairs restored by ConfigManager.reset_to_defaults()
+_RESET_DEFAULTS = (
+	("cursorTracking", True),
+	("cursorTrackingMode", CT_STANDARD),
+	("keyEcho", True),
+	("linePause", True),
+	("punctuationLevel", PUNCT_MOST),
+	("repeatedSymbols", False),
+	("repeatedSymbolsValues", "-_=!"),
+	("cursorDelay", 20),
+	("quietMode", False),
+	("verboseMode", False),
+	("indentationOnLineRead", False),
+	("windowTop", 0),
+	("windowBottom", 0),
+	("windowLeft", 0),
+	("windowRight", 0),
+	("windowEnabled", False),
+)
+
 
 # Input validation helper functions for security hardening
 def _validateInteger(value: Any, minValue: int, maxValue: int, default: int, fieldName: str) -> int:
@@ -105,6 +125,10 @@ def _validateInteger(value: Any, minValue: int, maxValue: int, default: int, fie
 	Returns:
 		int: Validated value or default if invalid
 	"""
+	# Fast path: config values are almost always in-range ints already.
+	# The exact type check keeps bools on the normalizing path below.
+	if type(value) is int and minValue <= value <= maxValue:
+		return value
 	try:
 		intValue = int(value)
 		if minValue <= intValue <= maxValue:
@@ -338,19 +362,6 @@ class ConfigManager:
 
 	def reset_to_defaults(self) -> None:
 		"""Reset all configuration values to their defaults."""
-		config.conf["terminalAccess"]["cursorTracking"] = True
-		config.conf["terminalAccess"]["cursorTrackingMode"] = CT_STANDARD
-		config.conf["terminalAccess"]["keyEcho"] = True
-		config.conf["terminalAccess"]["linePause"] = True
-		config.conf["terminalAccess"]["punctuationLevel"] = PUNCT_MOST
-		config.conf["terminalAccess"]["repeatedSymbols"] = False
-		config.conf["terminalAccess"]["repeatedSymbolsValues"] = "-_=!"
-		config.conf["terminalAccess"]["cursorDelay"] = 20
-		config.conf["terminalAccess"]["quietMode"] = False
-		config.conf["terminalAccess"]["verboseMode"] = False
-		config.conf["terminalAccess"]["indentationOnLineRead"] = False
-		config.conf["terminalAccess"]["windowTop"] = 0
-		config.conf["terminalAccess"]["windowBottom"] = 0
-		config.conf["terminalAccess"]["windowLeft"] = 0
-		config.conf["terminalAccess"]["windowRight"] = 0
-		config.conf["terminalAccess"]["windowEnabled"] = False
+		section = config.conf["terminalAccess"]
+		for key, default in _RESET_DEFAULTS:
+			section[key] = default
@@ -3,6 +3,7 @@
 
 import collections
 import re
+import sys
 
 import api
 import textInfos
@@ -50,6 +51,9 @@ _URL_PATTERN: re.Pattern[str] = re.compile(
 	re.IGNORECASE
 )
 
+# Whitespace and common punctuation separating words for fuzzy search.
+_FUZZY_WORD_SPLIT: re.Pattern[str] = re.compile(r'[\s:;,.()\[\]{}=<>!@#$%^&*|/\\]+')
+
 
 def _clean_url(url: str) -> str:
 	"""Strip trailing punctuation that is likely not part of the URL."""
@@ -64,6 +68,45 @@ def _clean_url(url: str) -> str:
 	return url
 
 
+def _find_line_matches(haystack: str, needle: str) -> list[tuple[int, int]]:
+	"""Locate the first occurrence of *needle* on each line of *haystack*.
+
+	Runs ``str.find`` over the whole buffer and skips to the next line after
+	each hit, so only matching lines cost Python-level work.  Line numbers
+	are recovered with ``str.count`` between hits.
+
+	Scanning line by line is deliberately avoided: one call over the whole
+	buffer lets CPython's two-way/Horspool search amortize its needle
+	preprocessing across the full haystack instead of redoing it per line.
+
+	Args:
+		haystack: Newline-separated buffer text
+		needle: Substring to find; never matches across a line break
+
+	Returns:
+		list[tuple[int, int]]: (0-based line index, column) per matching line
+	"""
+	found: list[tuple[int, int]] = []
+	if '\n' in needle:
+		return found
+	line_index = 0
+	line_start = 0
+	pos = haystack.find(needle)
+	while pos >= 0:
+		skipped = haystack.count('\n', line_start, pos)
+		if skipped:
+			line_index += skipped
+			line_start = haystack.rfind('\n', line_start, pos) + 1
+		found.append((line_index, pos - line_start))
+		line_end = haystack.find('\n', pos)
+		if line_end < 0:
+			break
+		line_index += 1
+		line_start = line_end + 1
+		pos = haystack.find(needle, line_start)
+	return found
+
+
 class OutputSearchManager:
 	"""
 	Search and filter terminal output with pattern matching.
@@ -116,6 +159,21 @@ class OutputSearchManager:
 		self._use_regex = False
 		# Per-tab storage
 		self._tab_searches = {}  # tab_id -> {pattern, matches, index, case_sensitive, use_regex}
+		# Last locally computed result: (key, matches, message), where key is
+		# the raw buffer's (length, hash) plus the search arguments, so no
+		# copy of the buffer is kept.
+		self._search_cache = None
+		# (length, hash) of the last stripped buffer and its lower() for
+		# case-insensitive scans.
+		self._lowered_text = None
+
+	def _lower_buffer(self, text: str) -> str:
+		"""Return text.lower(), reusing the last result while the buffer is unchanged."""
+		fingerprint = (len(text), hash(text))
+		lowered = self._lowered_text
+		if lowered is None or lowered[0] != fingerprint:
+			lowered = self._lowered_text = (fingerprint, text.lower())
+		return lowered[1]
 
 	def _get_current_tab_id(self) -> str:
 		"""Get current tab ID, or None if no tab manager."""
@@ -165,6 +223,9 @@ class OutputSearchManager:
 	MAX_PATTERN_LENGTH = 500
 	MAX_MATCHES = 1000
 	MAX_LINE_LENGTH = 10000
+	# Matched lines up to this length are interned so repeated lines
+	# (prompts, log prefixes) share one string across stored matches.
+	INTERN_LINE_LENGTH = 64
 
 	def search(self, pattern: str, case_sensitive: bool = False,
 			  use_regex: bool = False, scope: str = "buffer",
@@ -203,10 +264,12 @@ class OutputSearchManager:
 
 		# Validate regex early so callers get a clear error instead of a
 		# silent 0-match result buried inside the broad except below.
+		# The compiled pattern is reused for line matching and offsets.
+		compiled = None
 		if use_regex:
 			try:
 				flags = 0 if case_sensitive else re.IGNORECASE
-				re.compile(pattern, flags)
+				compiled = re.compile(pattern, flags)
 			except re.error as exc:
 				try:
 					import logHandler
@@ -223,25 +286,29 @@ class OutputSearchManager:
 
 		max_line = self.MAX_LINE_LENGTH
 		max_matches = self.MAX_MATCHES
+		intern_line = self.INTERN_LINE_LENGTH
+		cache_key = None
 
 		def _store_match(line_text, line_num, char_offset):
 			"""Store a search match as a lightweight tuple.
 
 			No TextInfo or bookmark is created here. The TextInfo is resolved
 			lazily in _jump_to_match_index() when the user selects a match.
-			Line text is truncated to MAX_LINE_LENGTH for safety.
+			Line text is truncated to MAX_LINE_LENGTH for safety, and short
+			lines are interned.
 			"""
 			if len(matches) >= max_matches:
 				return
 			if len(line_text) > max_line:
 				line_text = line_text[:max_line]
+			elif len(line_text) <= intern_line:
+				line_text = sys.intern(line_text)
 			matches.append((None, line_text, line_num, None, char_offset))
 
-		def _find_match_offset(line_text, pattern, case_sensitive, use_regex):
+		def _find_match_offset(line_text):
 			"""Find the character offset of the first match in the line."""
-			if use_regex:
-				flags = 0 if case_sensitive else re.IGNORECASE
-				match = re.search(pattern, line_text, flags)
+			if compiled is not None:
+				match = compiled.search(line_text)
 				return match.start() if match else 0
 			else:
 				search_pattern = pattern if case_sensitive else pattern.lower()
@@ -283,7 +350,7 @@ class OutputSearchManager:
 				# line_text/offset maps from the response.
 				resp = helper_search_result
 				matching_indices = [m["line_index"] for m in resp.get("matches", [])]
-				native_offset_map = {
+				offset_map = {
 					m["line_index"]: m["char_offset"]
 					for m in resp.get("matches", [])
 				}
@@ -302,12 +369,31 @@ class OutputSearchManager:
 				if not all_text:
 					return 0
 
+				# An unchanged buffer searched with the same arguments
+				# yields the same matches: skip stripping and rescanning.
+				# The caret line only matters for section scope.
+				fingerprint = (len(all_text), hash(all_text))
+				cache_key = (
+					fingerprint, pattern, case_sensitive, use_regex, scope,
+					current_line if scope == "section" else None,
+				)
+				cached = self._search_cache
+				if cached is not None:
+					if cached[0] == cache_key:
+						self._last_search_message = cached[2]
+						return self._store_results(pattern, list(cached[1]), case_sensitive, use_regex)
+					if cached[0][0] != fingerprint:
+						# Buffer replaced: drop results and the lowered copy
+						# of the old one.
+						self._search_cache = None
+						self._lowered_text = None
+
 				# Strip ANSI escape sequences that some terminals leave
 				# in the text buffer.
 				all_text = _rt.strip_ansi(all_text)
 
 				helper_line_texts = None
-				native_offset_map = None
+				offset_map = None
 				native_line_texts = None
 				lines = None
 
@@ -318,7 +404,7 @@ class OutputSearchManager:
 							all_text, pattern, case_sensitive, use_regex,
 						)
 						matching_indices = [m[0] for m in native_matches]
-						native_offset_map = {m[0]: m[1] for m in native_matches}
+						offset_map = {m[0]: m[1] for m in native_matches}
 						native_line_texts = {m[0]: m[2] for m in native_matches}
 						# Count newlines instead of splitting to get total_lines.
 						total_lines = all_text.count('\n') + 1
@@ -330,24 +416,25 @@ class OutputSearchManager:
 							logHandler.log.debug("Terminal Access: native search_text failed", exc_info=True)
 						except Exception:
 							pass
-						native_offset_map = None
+						offset_map = None
 						native_line_texts = None
 
-				if native_offset_map is None:
+				if offset_map is None:
 					# Python fallback: need full line split.
 					lines = all_text.split('\n')
 					total_lines = len(lines)
 					native_line_texts = None
-					if use_regex:
-						flags = 0 if case_sensitive else re.IGNORECASE
-						compiled = re.compile(pattern, flags)
+					if compiled is not None:
 						matching_indices = [i for i, line in enumerate(lines) if compiled.search(line)]
 					else:
-						search_pattern = pattern if case_sensitive else pattern.lower()
-						matching_indices = [
-							i for i, line in enumerate(lines)
-							if search_pattern in (line if case_sensitive else line.lower())
-						]
+						# One scan over the whole buffer instead of a
+						# membership test (and lower()) per line.
+						if case_sensitive:
+							found = _find_line_matches(all_text, pattern)
+						else:
+							found = _find_line_matches(self._lower_buffer(all_text), pattern.lower())
+						matching_indices = [line_index for line_index, _col in found]
+						offset_map = dict(found)
 
 			# ─── Section scoping ───
 			# When scope="section", restrict matching_indices to lines
@@ -446,26 +533,16 @@ class OutputSearchManager:
 
 			for line_index in matching_indices:
 				line_text = _get_line_text(line_index)
-				if native_offset_map is not None and line_index in native_offset_map:
-					char_offset = native_offset_map[line_index]
+				if offset_map is not None and line_index in offset_map:
+					char_offset = offset_map[line_index]
 				else:
-					char_offset = _find_match_offset(line_text, pattern, case_sensitive, use_regex)
+					char_offset = _find_match_offset(line_text)
 				_store_match(line_text, line_index + 1, char_offset)
 
-			# Record pattern in search history.
-			self.add_to_history(pattern)
-
-			# Save results through the tab-aware state mechanism so
-			# multi-tab and legacy modes stay in sync.
-			self._save_search_state({
-				'pattern': pattern,
-				'matches': matches,
-				'current_match_index': -1,
-				'case_sensitive': case_sensitive,
-				'use_regex': use_regex
-			})
+			if cache_key is not None:
+				self._search_cache = (cache_key, tuple(matches), self._last_search_message)
 
-			return len(matches)
+			return self._store_results(pattern, matches, case_sensitive, use_regex)
 
 		except Exception:
 			try:
@@ -475,6 +552,27 @@ class OutputSearchManager:
 				pass
 			return 0
 
+	def _store_results(self, pattern: str, matches: list,
+			case_sensitive: bool, use_regex: bool) -> int:
+		"""Record *pattern* in history and save *matches* as the current search.
+
+		Returns:
+			int: Number of matches stored
+		"""
+		self.add_to_history(pattern)
+
+		# Save results through the tab-aware state mechanism so
+		# multi-tab and legacy modes stay in sync.
+		self._save_search_state({
+			'pattern': pattern,
+			'matches': matches,
+			'current_match_index': -1,
+			'case_sensitive': case_sensitive,
+			'use_regex': use_regex
+		})
+
+		return len(matches)
+
 	def next_match(self) -> bool:
 		"""
 		Jump to next match.
@@ -657,7 +755,9 @@ class OutputSearchManager:
 		return results
 
 	def clear_search(self) -> None:
-		"""Clear current search results."""
+		"""Clear current search results and the cached buffer scan."""
+		self._search_cache = None
+		self._lowered_text = None
 		self._save_search_state({
 			'pattern': None,
 			'matches': [],
@@ -735,8 +835,7 @@ class OutputSearchManager:
 		"""Check whether any word in *line* is within Levenshtein
 		distance 1 of *pattern* (case-insensitive)."""
 		pat_lower = pattern.lower()
-		# Split on whitespace and common punctuation to get words.
-		words = re.split(r'[\s:;,.()\[\]{}=<>!@#$%^&*|/\\]+', line)
+		words = _FUZZY_WORD_SPLIT.split(line)
 		for word in words:
 			if not word:
 				continue
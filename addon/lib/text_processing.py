@@ -351,6 +351,10 @@ class ANSIParser:
 		Returns:
 			str: Text with ANSI codes removed
 		"""
+		# Every sequence the pattern matches starts with ESC, so plain
+		# output (the common case) skips the regex pass entirely.
+		if '\x1b' not in text:
+			return text
 		return ANSIParser._STRIP_PATTERN.sub('', text)
 
 
@@ -3,6 +3,8 @@
 
 import time
 import threading
+from bisect import bisect_right
+from itertools import accumulate
 import textInfos
 import ui
 from typing import Any
@@ -181,7 +183,8 @@ class PositionCalculator:
 	with performance optimization through caching and incremental tracking.
 
 	Performance:
-		- First calculation: O(n) where n = row number
+		- First calculation: O(n) where n = row number; O(log n) for
+		  offset-based bookmarks once the buffer's line index is built
 		- Cached calculation: O(1)
 		- Incremental calculation: O(k) where k = distance moved
 
@@ -198,6 +201,12 @@ class PositionCalculator:
 		"""Initialize the position calculator with empty cache."""
 		self._cache = _rt.make_position_cache()
 		self._last_known_position: tuple[Any, int, int] | None = None
+		# Line-start offsets of the last buffer text seen by _line_index()
+		self._indexed_text: str | None = None
+		self._line_starts: list[int] = []
+		# Whether the terminal's UNIT_LINE rows match _line_starts one to
+		# one (no wrapped rows); None until checked for the indexed text.
+		self._line_units_match: bool | None = None
 
 	def calculate(self, textInfo: Any, terminal: Any) -> tuple[int, int]:
 		"""
@@ -400,6 +409,99 @@ class PositionCalculator:
 		except Exception:
 			return buffer_row
 
+	def _line_index(self, text: str) -> list[int]:
+		"""
+		Return the start offset of every line in *text*.
+
+		The table is rebuilt only when the buffer text differs from the
+		last call, so repeated lookups on an unchanged screen are a single
+		string comparison.
+
+		TextInfo offsets may count UTF-16 code units, so any character
+		outside the BMP would shift every later line start.  Such buffers
+		get an empty table and callers fall back to walking lines.
+
+		Args:
+			text: Full buffer text
+
+		Returns:
+			Ascending list of line-start offsets, beginning with 0, or an
+			empty list if the text contains non-BMP characters
+		"""
+		if text != self._indexed_text:
+			if text.isascii() or max(text) <= '\uffff':
+				lines = text.split('\n')
+				self._line_starts = [0, *accumulate(len(line) + 1 for line in lines[:-1])]
+			else:
+				self._line_starts = []
+			self._indexed_text = text
+			self._line_units_match = None
+		return self._line_starts
+
+	@staticmethod
+	def _count_line_units(terminal: Any, limit: int) -> int:
+		"""
+		Count the terminal's UNIT_LINE rows, stopping once *limit* is passed.
+
+		Args:
+			terminal: Terminal object
+			limit: Row count of interest; walking stops after limit + 1 rows
+
+		Returns:
+			Number of rows, or -1 if the walk failed
+		"""
+		try:
+			info = terminal.makeTextInfo(textInfos.POSITION_FIRST)
+			info.collapse()
+			rows = 1
+			while rows <= limit and info.move(textInfos.UNIT_LINE, 1) != 0:
+				rows += 1
+			return rows
+		except Exception:
+			return -1
+
+	def _row_from_line_index(self, terminal: Any,
+							 lineStart: Any) -> tuple[int, int] | None:
+		"""
+		Resolve the buffer row of a line start by bisecting the line index.
+
+		Only offset-based TextInfos (whose bookmarks carry an integer
+		startOffset) qualify, and only on buffers without non-BMP
+		characters.  The index is trusted only if the terminal has one
+		UNIT_LINE row per newline-delimited line: wrapped rows above the
+		target would otherwise make the index report a smaller row than
+		the walk.  That is checked with one full walk per buffer text.
+		The result is used only when the offset is exactly a line start.
+
+		Args:
+			terminal: Terminal object
+			lineStart: TextInfo collapsed at the start of the target line
+
+		Returns:
+			(buffer_row, total_lines) tuple, or None to fall back to walking
+		"""
+		offset = getattr(lineStart.bookmark, 'startOffset', None)
+		if type(offset) is not int:
+			return None
+		try:
+			text = terminal.makeTextInfo(textInfos.POSITION_ALL).text
+		except Exception:
+			return None
+		if not text or offset > len(text):
+			return None
+		line_starts = self._line_index(text)
+		if not line_starts:
+			return None
+		if self._line_units_match is None:
+			rows = self._count_line_units(terminal, len(line_starts))
+			self._line_units_match = rows == len(line_starts)
+		if not self._line_units_match:
+			return None
+		line = bisect_right(line_starts, offset) - 1
+		if line_starts[line] != offset:
+			return None
+		return (line + 1, len(line_starts))
+
 	def _calculate_full(self, textInfo: Any, terminal: Any,
 					   bookmark: Any) -> tuple[int, int]:
 		"""
@@ -413,46 +515,51 @@ class PositionCalculator:
 		Returns:
 			(row, col) tuple
 		"""
-		# Start from beginning of buffer and count lines forward to the target
-		startInfo = terminal.makeTextInfo(textInfos.POSITION_FIRST)
-		startInfo.collapse()
-
-		# Calculate row by counting lines
 		targetCopy = textInfo.copy()
 		targetCopy.collapse()
 
-		# Count how many lines from buffer start until target
-		lineCount = 0
-		while startInfo.compareEndPoints(targetCopy, "startToStart") < 0:
-			moved = startInfo.move(textInfos.UNIT_LINE, 1)
-			if moved == 0:
-				break
-			lineCount += 1
+		lineStart = targetCopy.copy()
+		lineStart.expand(textInfos.UNIT_LINE)
+		lineStart.collapse()
+
+		# Offset-based bookmarks resolve the row from the buffer's line
+		# index; otherwise count lines forward from the buffer start.
+		indexed = self._row_from_line_index(terminal, lineStart)
+		if indexed is not None:
+			buffer_row, total_lines = indexed
+		else:
+			total_lines = None
+			startInfo = terminal.makeTextInfo(textInfos.POSITION_FIRST)
+			startInfo.collapse()
+
+			# Count how many lines from buffer start until target
+			lineCount = 0
+			while startInfo.compareEndPoints(targetCopy, "startToStart") < 0:
+				moved = startInfo.move(textInfos.UNIT_LINE, 1)
+				if moved == 0:
+					break
+				lineCount += 1
 
-		buffer_row = lineCount + 1
+			buffer_row = lineCount + 1
 
 		# Compensate for scrollback on conhost.  Only do the expensive
 		# POSITION_ALL read when the terminal actually needs it — Windows
 		# Terminal is already viewport-relative, so we skip the extra UIA call.
 		if self._needs_scrollback_compensation(terminal):
-			total_lines = 1
-			try:
-				all_info = terminal.makeTextInfo(textInfos.POSITION_ALL)
-				all_text = all_info.text
-				if all_text:
-					total_lines = all_text.count('\n') + 1
-			except Exception:
-				pass
+			if total_lines is None:
+				total_lines = 1
+				try:
+					all_info = terminal.makeTextInfo(textInfos.POSITION_ALL)
+					all_text = all_info.text
+					if all_text:
+						total_lines = all_text.count('\n') + 1
+				except Exception:
+					pass
 			row = self._to_viewport_row(buffer_row, total_lines, terminal)
 		else:
 			row = buffer_row
 
 		# Calculate column by counting characters from line start
-		lineStart = targetCopy.copy()
-		lineStart.expand(textInfos.UNIT_LINE)
-		lineStart.collapse()
-
-		# Create range from line start to target and count characters
 		charRange = lineStart.copy()
 		charRange.setEndPoint(targetCopy, "endToEnd")
 		charsFromLineStart = len(charRange.text) if charRange.text else 0
@@ -468,6 +575,9 @@ class PositionCalculator:
 		"""Clear all cached positions."""
 		self._cache.clear()
 		self._last_known_position = None
+		self._indexed_text = None
+		self._line_starts = []
+		self._line_units_match = None
 
 	def invalidate_position(self, bookmark: Any) -> None:
 		"""
@@ -533,6 +643,9 @@ class WindowMonitor:
 		self._debounce_ms = debounce_ms
 		self._debounce_pending = {}  # window_name -> (content, timestamp)
 		self._debounce_last_announced = {}  # window_name -> last announced content
+		# Time sources for the polling loop; tests substitute a manual clock.
+		self._clock = time.time
+		self._sleep = time.sleep
 
 	def add_monitor(self, name: str, window_bounds: tuple, interval_ms: int = 500, mode: str = 'changes'):
 		"""
@@ -647,34 +760,45 @@ class WindowMonitor:
 
 	def _monitor_loop(self) -> None:
 		"""Background monitoring loop."""
-		while True:
-			# Collect monitors that are due for a check while holding the
-			# lock, then release it *before* any I/O.  _check_window calls
-			# _read_terminal_text_on_main which blocks waiting for the main
-			# thread -- holding the lock during that call would deadlock if
-			# the main thread tried to acquire it (e.g. stop_monitoring).
-			due_monitors = []
-			with self._lock:
-				if not self._monitoring_active:
-					break
+		while self._poll_once():
+			# Sleep briefly to avoid busy-waiting
+			self._sleep(0.1)
+
+	def _poll_once(self) -> bool:
+		"""
+		Check every enabled monitor whose polling interval has elapsed.
 
-				current_time = time.time() * 1000  # Convert to milliseconds
+		Runs one iteration of the monitoring loop on the calling thread,
+		using ``self._clock`` for timestamps.
 
-				for monitor in self._monitors:
-					if not monitor['enabled']:
-						continue
-					time_since_check = current_time - monitor['last_check']
-					if time_since_check >= monitor['interval']:
-						due_monitors.append(monitor)
+		Returns:
+			bool: False once monitoring has been stopped, True otherwise
+		"""
+		# Collect monitors that are due for a check while holding the
+		# lock, then release it *before* any I/O.  _check_window calls
+		# _read_terminal_text_on_main which blocks waiting for the main
+		# thread -- holding the lock during that call would deadlock if
+		# the main thread tried to acquire it (e.g. stop_monitoring).
+		due_monitors = []
+		with self._lock:
+			if not self._monitoring_active:
+				return False
 
-			# Perform I/O outside the lock to avoid deadlock.
-			for monitor in due_monitors:
-				current_time = time.time() * 1000
-				self._check_window(monitor, current_time)
-				monitor['last_check'] = current_time
+			current_time = self._clock() * 1000  # Convert to milliseconds
 
-			# Sleep briefly to avoid busy-waiting
-			time.sleep(0.1)
+			for monitor in self._monitors:
+				if not monitor['enabled']:
+					continue
+				time_since_check = current_time - monitor['last_check']
+				if time_since_check >= monitor['interval']:
+					due_monitors.append(monitor)
+
+		# Perform I/O outside the lock to avoid deadlock.
+		for monitor in due_monitors:
+			current_time = self._clock() * 1000
+			self._check_window(monitor, current_time)
+			monitor['last_check'] = current_time
+		return True
 
 	def _check_window(self, monitor: dict, current_time: float) -> None:
 		"""
@@ -803,7 +927,7 @@ class WindowMonitor:
 			name: Monitor/window name
 			content: New content text
 		"""
-		now = time.time() * 1000  # milliseconds
+		now = self._clock() * 1000  # milliseconds
 
 		# Suppress identical content
 		if self._debounce_last_announced.get(name) == content:
@@ -521,7 +521,7 @@ class NativePositionCache:
 
 	# Default values matching the Python PositionCache
 	MAX_CACHE_SIZE = 100
-	CACHE_TIMEOUT_MS = 1000  # 1 second, matches CACHE_TIMEOUT_S = 1.0
+	CACHE_TIMEOUT_MS = 1000  # 1 second, matches CACHE_TIMEOUT_NS
 
 	__slots__ = ("_handle", "_lib")
 
@@ -4,7 +4,7 @@ pytest configuration and fixtures for Terminal Access tests.
 import sys
 import os
 import types
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 import pytest
 
@@ -149,42 +149,57 @@ _rt.api_module = sys.modules['api']
 _rt.webbrowser_module = MagicMock()
 
 
+# Single source of truth for the default config.  Every value is an
+# immutable primitive, so copying each section dict is a full copy.
+_DEFAULT_CONF = {
+    "terminalAccess": {
+        "cursorTracking": True,
+        "cursorTrackingMode": 1,
+        "keyEcho": True,
+        "linePause": True,
+        "processSymbols": False,
+        "punctuationLevel": 2,
+        "repeatedSymbols": False,
+        "repeatedSymbolsValues": "-_=!",
+        "cursorDelay": 20,
+        "quietMode": False,
+        "verboseMode": False,
+        "indentationOnLineRead": False,
+        "windowTop": 0,
+        "windowBottom": 0,
+        "windowLeft": 0,
+        "windowRight": 0,
+        "windowEnabled": False,
+        "unboundGestures": "",
+    },
+    "keyboard": {
+        "speakTypedCharacters": False,
+    },
+}
+
+
 def _default_conf_dict():
-    """Single source of truth for the default config dict."""
-    return {
-        "terminalAccess": {
-            "cursorTracking": True,
-            "cursorTrackingMode": 1,
-            "keyEcho": True,
-            "linePause": True,
-            "processSymbols": False,
-            "punctuationLevel": 2,
-            "repeatedSymbols": False,
-            "repeatedSymbolsValues": "-_=!",
-            "cursorDelay": 20,
-            "quietMode": False,
-            "verboseMode": False,
-            "indentationOnLineRead": False,
-            "windowTop": 0,
-            "windowBottom": 0,
-            "windowLeft": 0,
-            "windowRight": 0,
-            "windowEnabled": False,
-            "unboundGestures": "",
-        },
-        "keyboard": {
-            "speakTypedCharacters": False,
-        },
-    }
-
-
-# Set up mock config using the single source of truth
+    """Return a fresh, mutable copy of the default config dict."""
+    return {section: dict(values) for section, values in _DEFAULT_CONF.items()}
+
+
+class _FakeConf(dict):
+    """Stand-in for ``config.conf``: a plain dict plus the ``spec`` attribute.
+
+    Item access goes straight to dict's C slots instead of a Mock
+    attribute lookup and a Python lambda on every ``config.conf[...]`` read.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spec = {}
+
+
+# Set up mock config using the single source of truth.  This one object
+# serves the whole session; ensure_mocks refills it in place per test.
 config_mock = sys.modules['config']
-conf_dict = _default_conf_dict()
-config_mock.conf = Mock()
-config_mock.conf.__getitem__ = lambda self, key: conf_dict[key]
-config_mock.conf.__setitem__ = lambda self, key, value: conf_dict.__setitem__(key, value)
-config_mock.conf.spec = {}
+_SESSION_CONF = _FakeConf(_default_conf_dict())
+config_mock.conf = _SESSION_CONF
 
 
 @pytest.fixture
@@ -222,6 +237,18 @@ def reset_config():
     yield
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _patch_nvda_settings_dialog():
+    """Replace NVDASettingsDialog for the whole session.
+
+    GlobalPlugin.__init__ registers its settings panel in
+    ``NVDASettingsDialog.categoryClasses``; patching once here keeps that
+    list from growing without each test opening its own patch context.
+    """
+    with patch.object(settings_dialogs_mock, 'NVDASettingsDialog'):
+        yield
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _prevent_helper_spawn():
     """Prevent tests from spawning a real helper process.
@@ -288,25 +315,28 @@ def ensure_mocks():
     Restores deleted modules and resets the shared config dict so
     mutations from one test don't leak into the next.
     """
-    # Restore any deleted modules
+    # Restore any deleted modules (one lookup per name)
     for name, original in _MOCK_SNAPSHOT.items():
-        if name not in sys.modules:
-            sys.modules[name] = original
+        sys.modules.setdefault(name, original)
 
     # Reset config dict to defaults before each test
+    # (tests that swap in their own config.conf get the session one back).
     config_mock = sys.modules.get('config')
     if config_mock is not None:
-        fresh = _default_conf_dict()
-        try:
-            config_mock.conf.__getitem__ = lambda self, key: fresh[key]
-            config_mock.conf.__setitem__ = lambda self, key, value: fresh.__setitem__(key, value)
-            config_mock.conf.spec = {}
-        except (AttributeError, TypeError):
-            pass
+        config_mock.conf = _SESSION_CONF
+        _SESSION_CONF.clear()
+        _SESSION_CONF.update(_default_conf_dict())
+        _SESSION_CONF.spec = {}
 
     yield
 
 
+@pytest.fixture
+def conf(ensure_mocks):
+    """The freshly reset ``terminalAccess`` config section for this test."""
+    return _SESSION_CONF["terminalAccess"]
+
+
 @pytest.fixture
 def make_focus():
     """Factory fixture for creating mock NVDA focus objects.
@@ -4,11 +4,31 @@ Unit tests for PositionCache class.
 Tests the position caching system added in v1.0.15.
 """
 import unittest
-from unittest.mock import Mock, patch
-import time
+from unittest.mock import MagicMock, patch
 import threading
 
 
+class _Offsets:
+    """Stand-in for NVDA's textInfos.offsets.Offsets: __eq__ without __hash__."""
+
+    def __init__(self, startOffset, endOffset):
+        self.startOffset = startOffset
+        self.endOffset = endOffset
+
+    def __eq__(self, other):
+        return (self.startOffset, self.endOffset) == (other.startOffset, other.endOffset)
+
+
+class _ComBookmark:
+    """Stand-in for a COM TextInfo bookmark: identity hash, value str()."""
+
+    def __init__(self, position):
+        self._position = position
+
+    def __str__(self):
+        return self._position
+
+
 class TestPositionCache(unittest.TestCase):
     """Test PositionCache class."""
 
@@ -24,8 +44,7 @@ class TestPositionCache(unittest.TestCase):
 
     def test_cache_set_and_get(self):
         """Test setting and getting a cached position."""
-        bookmark = Mock()
-        bookmark.__str__ = Mock(return_value="test_bookmark_1")
+        bookmark = _ComBookmark("test_bookmark_1")
 
         self.cache.set(bookmark, 10, 5)
         result = self.cache.get(bookmark)
@@ -35,61 +54,107 @@ class TestPositionCache(unittest.TestCase):
 
     def test_cache_get_nonexistent(self):
         """Test getting a non-existent cache entry."""
-        bookmark = Mock()
-        bookmark.__str__ = Mock(return_value="nonexistent")
+        bookmark = _ComBookmark("nonexistent")
 
         result = self.cache.get(bookmark)
         self.assertIsNone(result)
 
     def test_cache_expiration(self):
         """Test cache entries expire after timeout."""
-        bookmark = Mock()
-        bookmark.__str__ = Mock(return_value="test_bookmark_expire")
+        bookmark = _ComBookmark("test_bookmark_expire")
 
-        # Set timeout to very small value for testing
-        original_timeout = self.cache.CACHE_TIMEOUT_S
-        self.cache.CACHE_TIMEOUT_S = 0.01  # 10ms
+        with patch('lib.caching.time') as mock_time:
+            mock_time.monotonic_ns.return_value = 1_000_000
+            self.cache.set(bookmark, 10, 5)
 
-        self.cache.set(bookmark, 10, 5)
+            # Should be valid immediately
+            result = self.cache.get(bookmark)
+            self.assertIsNotNone(result)
 
-        # Should be valid immediately
-        result = self.cache.get(bookmark)
-        self.assertIsNotNone(result)
+            # Step the clock to the deadline
+            mock_time.monotonic_ns.return_value = 1_000_000 + self.cache.CACHE_TIMEOUT_NS
 
-        # Wait for expiration
-        time.sleep(0.02)  # 20ms
+            # Should be expired
+            result = self.cache.get(bookmark)
+            self.assertIsNone(result)
+
+    def test_cache_get_locks_only_to_reorder_or_drop(self):
+        """Misses read without the lock; a hit's reorder and expiry each take it once."""
+        self.cache._lock = MagicMock()
+
+        with patch('lib.caching.time') as mock_time:
+            mock_time.monotonic_ns.return_value = 1_000_000
+            self.cache._cache["hit"] = (1, 2, 1_000_000 + self.cache.CACHE_TIMEOUT_NS)
+            self.assertIsNone(self.cache.get("missing"))
+            self.cache._lock.__enter__.assert_not_called()
+            self.assertEqual(self.cache.get("hit"), (1, 2))
+            self.cache._lock.__enter__.assert_called_once()
+
+            mock_time.monotonic_ns.return_value = 1_000_000 + self.cache.CACHE_TIMEOUT_NS
+            self.assertIsNone(self.cache.get("hit"))
+            self.assertEqual(self.cache._lock.__enter__.call_count, 2)
+            self.assertNotIn("hit", self.cache._cache)
+
+    def test_cache_keys_offsets_bookmarks_by_value(self):
+        """Each bookmark read yields a new Offsets object; equal offsets must hit."""
+        self.cache.set(_Offsets(4, 5), 2, 3)
+
+        self.assertEqual(self.cache.get(_Offsets(4, 5)), (2, 3))
+        self.assertIsNone(self.cache.get(_Offsets(4, 6)))
+        self.cache.invalidate(_Offsets(4, 5))
+        self.assertEqual(len(self.cache._cache), 0)
 
-        # Should be expired
-        result = self.cache.get(bookmark)
-        self.assertIsNone(result)
+    def test_cache_key_choice(self):
+        """Value-hashable bookmarks key themselves; the rest key on offsets or str()."""
+        self.assertEqual(self.cache._key("bookmark"), "bookmark")
+        self.assertEqual(self.cache._key(_Offsets(1, 2)), (1, 2))
+        self.assertEqual(self.cache._key([1, 2]), "[1, 2]")
+        self.assertEqual(self.cache._key(_ComBookmark("pos-1")), "pos-1")
+
+    def test_cache_hits_for_distinct_equal_identity_hashed_bookmarks(self):
+        """Two bookmark objects for the same position share one entry."""
+        self.cache.set(_ComBookmark("pos-42"), 4, 2)
 
-        # Restore original timeout
-        self.cache.CACHE_TIMEOUT_S = original_timeout
+        self.assertEqual(self.cache.get(_ComBookmark("pos-42")), (4, 2))
+        self.assertIsNone(self.cache.get(_ComBookmark("pos-43")))
 
     def test_cache_max_size_limit(self):
         """Test cache respects maximum size limit."""
         # Fill cache to max size
         for i in range(self.cache.MAX_CACHE_SIZE):
-            bookmark = Mock()
-            bookmark.__str__ = Mock(return_value=f"bookmark_{i}")
+            bookmark = _ComBookmark(f"bookmark_{i}")
             self.cache.set(bookmark, i, i)
 
         self.assertEqual(len(self.cache._cache), self.cache.MAX_CACHE_SIZE)
 
         # Add one more - should evict oldest
-        new_bookmark = Mock()
-        new_bookmark.__str__ = Mock(return_value="new_bookmark")
+        new_bookmark = _ComBookmark("new_bookmark")
         self.cache.set(new_bookmark, 999, 999)
 
         # Cache size should remain at max
         self.assertEqual(len(self.cache._cache), self.cache.MAX_CACHE_SIZE)
 
+    def test_cache_eviction_is_least_recently_used(self):
+        """A get() hit protects an entry; overwriting a present key evicts nothing."""
+        for i in range(self.cache.MAX_CACHE_SIZE):
+            self.cache.set(f"bookmark_{i}", i, i)
+
+        # Touch the oldest entry, then overwrite the next-oldest in place.
+        self.assertEqual(self.cache.get("bookmark_0"), (0, 0))
+        self.cache.set("bookmark_1", 7, 7)
+        self.assertEqual(len(self.cache._cache), self.cache.MAX_CACHE_SIZE)
+
+        # The first real insertion evicts bookmark_2, now the least recent.
+        self.cache.set("new_bookmark", 999, 999)
+        self.assertIsNone(self.cache.get("bookmark_2"))
+        self.assertEqual(self.cache.get("bookmark_0"), (0, 0))
+        self.assertEqual(self.cache.get("bookmark_1"), (7, 7))
+
     def test_cache_clear(self):
         """Test clearing the cache."""
         # Add some entries
         for i in range(5):
-            bookmark = Mock()
-            bookmark.__str__ = Mock(return_value=f"bookmark_{i}")
+            bookmark = _ComBookmark(f"bookmark_{i}")
             self.cache.set(bookmark, i, i)
 
         self.assertEqual(len(self.cache._cache), 5)
@@ -100,10 +165,8 @@ class TestPositionCache(unittest.TestCase):
 
     def test_cache_invalidate_specific(self):
         """Test invalidating a specific cache entry."""
-        bookmark1 = Mock()
-        bookmark1.__str__ = Mock(return_value="bookmark_1")
-        bookmark2 = Mock()
-        bookmark2.__str__ = Mock(return_value="bookmark_2")
+        bookmark1 = _ComBookmark("bookmark_1")
+        bookmark2 = _ComBookmark("bookmark_2")
 
         self.cache.set(bookmark1, 10, 5)
         self.cache.set(bookmark2, 20, 10)
@@ -118,8 +181,7 @@ class TestPositionCache(unittest.TestCase):
 
     def test_cache_thread_safety(self):
         """Test cache is thread-safe."""
-        bookmark = Mock()
-        bookmark.__str__ = Mock(return_value="thread_test")
+        bookmark = _ComBookmark("thread_test")
 
         def writer_thread():
             for i in range(100):
@@ -142,12 +204,44 @@ class TestPositionCache(unittest.TestCase):
 
         # Should complete without errors
 
+    def test_concurrent_get_and_eviction(self):
+        """Hits racing with evicting writers never raise."""
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    for i in range(self.cache.MAX_CACHE_SIZE):
+                        self.cache.get(_ComBookmark(f"pos-{i}"))
+            except Exception as e:
+                errors.append(e)
+
+        def evicting_writer():
+            try:
+                for i in range(20 * self.cache.MAX_CACHE_SIZE):
+                    self.cache.set(_ComBookmark(f"pos-{i % (2 * self.cache.MAX_CACHE_SIZE)}"), i, i)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writers = [threading.Thread(target=evicting_writer) for _ in range(2)]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        stop.set()
+        for t in readers:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.cache._cache), self.cache.MAX_CACHE_SIZE)
+
     def test_cache_multiple_bookmarks(self):
         """Test caching multiple different bookmarks."""
         bookmarks = []
         for i in range(10):
-            bookmark = Mock()
-            bookmark.__str__ = Mock(return_value=f"bookmark_{i}")
+            bookmark = _ComBookmark(f"bookmark_{i}")
             bookmarks.append(bookmark)
             self.cache.set(bookmark, i * 10, i * 5)
 
@@ -159,8 +253,7 @@ class TestPositionCache(unittest.TestCase):
 
     def test_cache_update_existing(self):
         """Test updating an existing cache entry."""
-        bookmark = Mock()
-        bookmark.__str__ = Mock(return_value="update_test")
+        bookmark = _ComBookmark("update_test")
 
         self.cache.set(bookmark, 10, 5)
         result1 = self.cache.get(bookmark)
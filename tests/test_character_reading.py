@@ -205,20 +205,15 @@ class TestCharacterReading(unittest.TestCase):
 
 		# Clear the lru_cache so our mock takes effect
 		_get_symbol_description.cache_clear()
+		self.addCleanup(_get_symbol_description.cache_clear)
 
 		# Configure mock to return a locale-specific name
-		cp_mock = sys.modules['characterProcessing']
-		original_fn = cp_mock.processSpeechSymbol
-		cp_mock.processSpeechSymbol = lambda locale, sym: {'.': 'dot', '!': 'bang'}.get(sym, sym)
-
-		try:
+		with patch.object(sys.modules['characterProcessing'], 'processSpeechSymbol',
+				lambda locale, sym: {'.': 'dot', '!': 'bang'}.get(sym, sym)):
 			plugin = GlobalPlugin()
 			self.assertEqual(plugin._processSymbol('.'), 'dot')
 			self.assertEqual(plugin._processSymbol('!'), 'bang')
 			self.assertEqual(plugin._processSymbol('a'), 'a')
-		finally:
-			cp_mock.processSpeechSymbol = original_fn
-			_get_symbol_description.cache_clear()
 
 	@patch('globalPlugins.terminalAccess.ui')
 	def test_processSymbol_falls_back_to_unicode_name(self, mock_ui):
@@ -227,19 +222,14 @@ class TestCharacterReading(unittest.TestCase):
 		from globalPlugins.terminalAccess import GlobalPlugin, _get_symbol_description
 
 		_get_symbol_description.cache_clear()
+		self.addCleanup(_get_symbol_description.cache_clear)
 
 		# Configure mock to return symbol unchanged (no mapping)
-		cp_mock = sys.modules['characterProcessing']
-		original_fn = cp_mock.processSpeechSymbol
-		cp_mock.processSpeechSymbol = lambda locale, sym: sym
-
-		try:
+		with patch.object(sys.modules['characterProcessing'], 'processSpeechSymbol',
+				lambda locale, sym: sym):
 			plugin = GlobalPlugin()
 			# Falls back to unicodedata.name: "!" → "exclamation mark"
 			self.assertEqual(plugin._processSymbol('!'), 'exclamation mark')
-		finally:
-			cp_mock.processSpeechSymbol = original_fn
-			_get_symbol_description.cache_clear()
 
 	@patch('globalPlugins.terminalAccess.ui')
 	def test_event_typedCharacter_speaks_symbol_name(self, mock_ui):
@@ -248,13 +238,11 @@ class TestCharacterReading(unittest.TestCase):
 		from globalPlugins.terminalAccess import GlobalPlugin, _get_symbol_description
 
 		_get_symbol_description.cache_clear()
+		self.addCleanup(_get_symbol_description.cache_clear)
 
 		# Configure mock to return locale-aware name
-		cp_mock = sys.modules['characterProcessing']
-		original_fn = cp_mock.processSpeechSymbol
-		cp_mock.processSpeechSymbol = lambda locale, sym: {'.': 'dot', '!': 'bang'}.get(sym, sym)
-
-		try:
+		with patch.object(sys.modules['characterProcessing'], 'processSpeechSymbol',
+				lambda locale, sym: {'.': 'dot', '!': 'bang'}.get(sym, sym)):
 			plugin = GlobalPlugin()
 			plugin.isTerminalApp = MagicMock(return_value=True)
 			plugin._boundTerminal = Mock()
@@ -263,9 +251,6 @@ class TestCharacterReading(unittest.TestCase):
 			plugin.event_typedCharacter(Mock(), lambda: None, '!')
 
 			mock_ui.message.assert_called_with('bang')
-		finally:
-			cp_mock.processSpeechSymbol = original_fn
-			_get_symbol_description.cache_clear()
 
 	# -- _getEffective and profile override tests --
 
@@ -6,10 +6,70 @@ particularly GlobalPlugin methods, ANSI parsing edge cases, and
 helper class functionality.
 """
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 import sys
 
 
+def _row_starts(buffer, wrap):
+    """Start offset of every screen row, wrapping lines longer than *wrap*."""
+    starts = []
+    line_start = 0
+    for line in buffer.split('\n'):
+        starts.extend(range(line_start, line_start + max(len(line), 1), wrap or max(len(line), 1)))
+        line_start += len(line) + 1
+    return starts
+
+
+class _OffsetsTextInfo:
+    """Offset-based TextInfo over a fixed buffer, like NVDA's OffsetsTextInfo.
+
+    UNIT_LINE follows screen rows: lines longer than *wrap* span several.
+    """
+
+    def __init__(self, buffer, start, end=None, wrap=None):
+        self._buffer = buffer
+        self._start = start
+        self._end = start if end is None else end
+        self._wrap = wrap
+        self._rows = _row_starts(buffer, wrap)
+
+    @property
+    def bookmark(self):
+        return SimpleNamespace(startOffset=self._start, endOffset=self._end)
+
+    @property
+    def text(self):
+        return self._buffer[self._start:self._end]
+
+    def copy(self):
+        return _OffsetsTextInfo(self._buffer, self._start, self._end, self._wrap)
+
+    def collapse(self):
+        self._end = self._start
+
+    def expand(self, unit):
+        self._start = max(row for row in self._rows if row <= self._start)
+        end = self._buffer.find('\n', self._start)
+        end = len(self._buffer) if end < 0 else end
+        if self._wrap:
+            end = min(end, self._start + self._wrap)
+        self._end = end
+
+    def move(self, unit, count):
+        later = [row for row in self._rows if row > self._start]
+        if not later:
+            return 0
+        self._start = self._end = later[0]
+        return 1
+
+    def compareEndPoints(self, other, which):
+        return (self._start > other._start) - (self._start < other._start)
+
+    def setEndPoint(self, other, which):
+        self._end = other._end
+
+
 class TestANSIParserComprehensive(unittest.TestCase):
     """Comprehensive tests for ANSIParser to cover all branches."""
 
@@ -170,6 +230,13 @@ class TestANSIParserComprehensive(unittest.TestCase):
         result = self.ANSIParser.stripANSI('')
         self.assertEqual(result, '')
 
+    def test_strip_ansi_skips_regex_without_escape(self):
+        """ESC-free text is returned as-is without running the strip pattern."""
+        text = 'plain output line'
+        with patch.object(self.ANSIParser, '_STRIP_PATTERN') as mock_pattern:
+            self.assertIs(self.ANSIParser.stripANSI(text), text)
+        mock_pattern.sub.assert_not_called()
+
 
 class TestUnicodeWidthHelperComprehensive(unittest.TestCase):
     """Comprehensive tests for UnicodeWidthHelper."""
@@ -374,13 +441,104 @@ class TestPositionCalculatorComprehensive(unittest.TestCase):
         self.assertIsInstance(result[1], int)
 
 
+class TestPositionCalculatorLineIndex(unittest.TestCase):
+    """Offset-based bookmarks resolve rows from the buffer's line index."""
+
+    _BUFFER = "first\nsecond line\nthird"
+
+    def setUp(self):
+        from globalPlugins.terminalAccess import PositionCalculator
+        self.calc = PositionCalculator()
+        self.positions = []
+        self.terminal = self._make_terminal(self._BUFFER)
+
+    def _make_terminal(self, buffer, wrap=None):
+        """Terminal over *buffer* that records each makeTextInfo position."""
+        import textInfos
+
+        def make_text_info(position):
+            self.positions.append(position)
+            if position is textInfos.POSITION_ALL:
+                return _OffsetsTextInfo(buffer, 0, len(buffer), wrap)
+            return _OffsetsTextInfo(buffer, 0, wrap=wrap)
+
+        return SimpleNamespace(
+            makeTextInfo=make_text_info,
+            appModule=SimpleNamespace(appName="windowsterminal"),
+        )
+
+    def test_row_and_column_from_offsets(self):
+        """The row comes from bisecting line starts; one walk checks the index per buffer."""
+        import textInfos
+        offset = self._BUFFER.index("third") + 2
+        target = _OffsetsTextInfo(self._BUFFER, offset)
+
+        self.assertEqual(self.calc.calculate(target, self.terminal), (3, 3))
+        self.assertEqual(self.calc._line_starts, [0, 6, 18])
+        self.assertEqual(self.positions.count(textInfos.POSITION_FIRST), 1)
+
+        self.calc._cache.clear()
+        self.calc._last_known_position = None
+        second = _OffsetsTextInfo(self._BUFFER, self._BUFFER.index("line"))
+        self.assertEqual(self.calc.calculate(second, self.terminal), (2, 8))
+        self.assertEqual(self.positions.count(textInfos.POSITION_FIRST), 1)
+
+    def test_wrapped_row_above_target_falls_back_to_line_walk(self):
+        """A wrapped row adds a UNIT_LINE row the newline index does not count."""
+        buffer = "first\n" + "x" * 10 + "\nthird"
+        terminal = self._make_terminal(buffer, wrap=8)
+        target = _OffsetsTextInfo(buffer, buffer.index("third") + 2, wrap=8)
+
+        # Rows: "first", "xxxxxxxx", "xx", "third"; the index alone says row 3.
+        self.assertEqual(self.calc.calculate(target, terminal), (4, 3))
+        self.assertIs(self.calc._line_units_match, False)
+
+    def test_line_index_reused_for_unchanged_text(self):
+        """An equal buffer text returns the same table without rebuilding."""
+        starts = self.calc._line_index(self._BUFFER)
+        self.assertIs(self.calc._line_index(str(self._BUFFER)), starts)
+        self.assertEqual(self.calc._line_index("a\n"), [0, 2])
+
+    def test_non_bmp_buffer_falls_back_to_line_walk(self):
+        """An emoji before the target line makes UTF-16 offsets disagree with str indices."""
+        # UTF-16 line starts are [0, 3, 6, 7]; str line starts are [0, 2, 5, 6],
+        # so the empty third line (UTF-16 offset 6) would be misread as row 4.
+        buffer = "\U0001F600\nab\n\ncd"
+        terminal = SimpleNamespace(
+            makeTextInfo=lambda position: _OffsetsTextInfo(buffer, 0, len(buffer)),
+        )
+        line_start = SimpleNamespace(bookmark=SimpleNamespace(startOffset=6))
+
+        self.assertIsNone(self.calc._row_from_line_index(terminal, line_start))
+        self.assertEqual(self.calc._line_index(buffer), [])
+
+
 class TestConfigManagerComprehensive(unittest.TestCase):
     """Comprehensive tests for ConfigManager."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    # (key, raw value, validated value) for ConfigManager._validate_key
+    _VALIDATION_CASES = (
+        ("cursorTrackingMode", 2, 2),
+        ("cursorTrackingMode", 9, 1),
+        ("cursorTrackingMode", -1, 1),
+        ("punctuationLevel", 3, 3),
+        ("punctuationLevel", 10, 2),
+        ("cursorDelay", 1000, 1000),
+        ("cursorDelay", 5000, 20),
+        ("windowTop", -10, 0),
+        ("windowRight", 80, 80),
+        ("repeatedSymbolsValues", "-_", "-_"),
+        ("repeatedSymbolsValues", "a" * 100, "a" * 50),
+        ("quietMode", 1, True),
+        ("windowEnabled", 0, False),
+        ("unknownKey", "kept", "kept"),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one ConfigManager; it reads config.conf on every call."""
         from globalPlugins.terminalAccess import ConfigManager
-        self.manager = ConfigManager()
+        cls.manager = ConfigManager()
 
     def test_get_config_value(self):
         """Test getting config values."""
@@ -396,11 +554,14 @@ class TestConfigManagerComprehensive(unittest.TestCase):
 
     def test_config_validation(self):
         """Test config values are validated."""
-        # Test with valid value
-        self.manager.set('punctuationLevel', 2)
+        for key, value, expected in self._VALIDATION_CASES:
+            with self.subTest(key=key, value=value):
+                self.assertEqual(self.manager._validate_key(key, value), expected)
 
-        # Test with invalid value (should be clamped or validated)
+    def test_set_stores_validated_value(self):
+        """Test set() stores the validated value, not the raw one."""
         self.manager.set('punctuationLevel', 10)
+        self.assertEqual(self.manager.get('punctuationLevel'), 2)
 
 
 class TestWindowManagerComprehensive(unittest.TestCase):
@@ -480,6 +641,12 @@ class TestValidationFunctionsComprehensive(unittest.TestCase):
         result = self._validateInteger(-10, 0, 100, 50, "test")
         self.assertEqual(result, 50)  # Returns default, not clamped
 
+    def test_validate_integer_normalizes_bool(self):
+        """A bool in range is returned as a plain int, not passed through."""
+        result = self._validateInteger(True, 0, 100, 50, "test")
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+
     def test_validate_integer_invalid_type(self):
         """Test _validateInteger with invalid type returns default."""
         result = self._validateInteger(None, 0, 100, 50, "test")
@@ -4,7 +4,7 @@ Unit tests for configuration management.
 Tests config sanitization and validation added in v1.0.16.
 """
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 import sys
 
 
@@ -39,17 +39,16 @@ class TestConfigurationSanitization(unittest.TestCase):
         from globalPlugins.terminalAccess import GlobalPlugin
 
         # Create mock for GUI dialog
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should not raise any errors
-            config_mock = sys.modules['config']
-            conf = config_mock.conf["terminalAccess"]
+        # Should not raise any errors
+        config_mock = sys.modules['config']
+        conf = config_mock.conf["terminalAccess"]
 
-            # Values should remain unchanged
-            self.assertEqual(conf["cursorTrackingMode"], 1)
-            self.assertEqual(conf["punctuationLevel"], 2)
-            self.assertEqual(conf["cursorDelay"], 20)
+        # Values should remain unchanged
+        self.assertEqual(conf["cursorTrackingMode"], 1)
+        self.assertEqual(conf["punctuationLevel"], 2)
+        self.assertEqual(conf["cursorDelay"], 20)
 
     def test_sanitize_config_invalid_tracking_mode(self):
         """Test _sanitizeConfig with invalid cursor tracking mode."""
@@ -59,11 +58,10 @@ class TestConfigurationSanitization(unittest.TestCase):
 
         from globalPlugins.terminalAccess import GlobalPlugin
 
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should be sanitized to default (1)
-            self.assertEqual(config_dict["cursorTrackingMode"], 1)
+        # Should be sanitized to default (1)
+        self.assertEqual(config_dict["cursorTrackingMode"], 1)
 
     def test_sanitize_config_invalid_punctuation_level(self):
         """Test _sanitizeConfig with invalid punctuation level."""
@@ -73,11 +71,10 @@ class TestConfigurationSanitization(unittest.TestCase):
 
         from globalPlugins.terminalAccess import GlobalPlugin
 
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should be sanitized to default (2)
-            self.assertEqual(config_dict["punctuationLevel"], 2)
+        # Should be sanitized to default (2)
+        self.assertEqual(config_dict["punctuationLevel"], 2)
 
     def test_sanitize_config_invalid_cursor_delay(self):
         """Test _sanitizeConfig with invalid cursor delay."""
@@ -87,11 +84,10 @@ class TestConfigurationSanitization(unittest.TestCase):
 
         from globalPlugins.terminalAccess import GlobalPlugin
 
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should be sanitized to default (20)
-            self.assertEqual(config_dict["cursorDelay"], 20)
+        # Should be sanitized to default (20)
+        self.assertEqual(config_dict["cursorDelay"], 20)
 
     def test_sanitize_config_long_repeated_symbols(self):
         """Test _sanitizeConfig with too long repeated symbols string."""
@@ -101,11 +97,10 @@ class TestConfigurationSanitization(unittest.TestCase):
 
         from globalPlugins.terminalAccess import GlobalPlugin
 
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should be truncated to MAX_REPEATED_SYMBOLS_LENGTH
-            self.assertEqual(len(config_dict["repeatedSymbolsValues"]), 50)
+        # Should be truncated to MAX_REPEATED_SYMBOLS_LENGTH
+        self.assertEqual(len(config_dict["repeatedSymbolsValues"]), 50)
 
     def test_sanitize_config_invalid_window_bounds(self):
         """Test _sanitizeConfig with invalid window bounds."""
@@ -116,12 +111,11 @@ class TestConfigurationSanitization(unittest.TestCase):
 
         from globalPlugins.terminalAccess import GlobalPlugin
 
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
+        plugin = GlobalPlugin()
 
-            # Should be sanitized
-            self.assertEqual(config_dict["windowTop"], 0)
-            self.assertEqual(config_dict["windowBottom"], 0)
+        # Should be sanitized
+        self.assertEqual(config_dict["windowTop"], 0)
+        self.assertEqual(config_dict["windowBottom"], 0)
 
 
 class TestConfigConstants(unittest.TestCase):
@@ -187,7 +181,7 @@ class TestConfigSpec(unittest.TestCase):
 
     def test_confspec_has_required_keys(self):
         """Test confspec has all required configuration keys."""
-        required_keys = [
+        required_keys = {
             "cursorTracking",
             "cursorTrackingMode",
             "keyEcho",
@@ -203,10 +197,10 @@ class TestConfigSpec(unittest.TestCase):
             "windowLeft",
             "windowRight",
             "windowEnabled",
-        ]
+        }
 
-        for key in required_keys:
-            self.assertIn(key, self.terminalAccess.confspec, f"Missing config key: {key}")
+        missing = required_keys - set(self.terminalAccess.confspec)
+        self.assertFalse(missing, f"Missing config keys: {sorted(missing)}")
 
 
 class TestConfigMigration(unittest.TestCase):
@@ -235,7 +229,7 @@ class TestConfigMigration(unittest.TestCase):
             "windowRight": 0,
             "windowEnabled": False,
         }
-        config_mock.conf.__getitem__ = MagicMock(return_value=config_dict)
+        config_mock.conf["terminalAccess"] = config_dict
 
         # Create ConfigManager which should trigger migration
         manager = ConfigManager()
@@ -268,7 +262,7 @@ class TestConfigMigration(unittest.TestCase):
             "windowRight": 0,
             "windowEnabled": False,
         }
-        config_mock.conf.__getitem__ = MagicMock(return_value=config_dict)
+        config_mock.conf["terminalAccess"] = config_dict
 
         # Create ConfigManager which should trigger migration
         manager = ConfigManager()
@@ -301,7 +295,7 @@ class TestConfigMigration(unittest.TestCase):
             "windowRight": 0,
             "windowEnabled": False,
         }
-        config_mock.conf.__getitem__ = MagicMock(return_value=config_dict)
+        config_mock.conf["terminalAccess"] = config_dict
 
         # Create ConfigManager which should trigger migration check
         manager = ConfigManager()
@@ -310,5 +304,31 @@ class TestConfigMigration(unittest.TestCase):
         self.assertEqual(config_dict["punctuationLevel"], PUNCT_ALL)
 
 
+class TestConfigReset(unittest.TestCase):
+    """Test ConfigManager.reset_to_defaults()."""
+
+    def test_reset_to_defaults_restores_every_key(self):
+        """Test every key in _RESET_DEFAULTS is restored to its default."""
+        from lib.config import ConfigManager, _RESET_DEFAULTS
+
+        manager = ConfigManager()
+        conf = sys.modules['config'].conf["terminalAccess"]
+        for key, default in _RESET_DEFAULTS:
+            conf[key] = "changed"
+
+        manager.reset_to_defaults()
+
+        for key, default in _RESET_DEFAULTS:
+            with self.subTest(key=key):
+                self.assertEqual(conf[key], default)
+
+    def test_reset_defaults_are_confspec_keys(self):
+        """Test reset_to_defaults only writes keys declared in confspec."""
+        from lib.config import confspec, _RESET_DEFAULTS
+
+        unknown = {key for key, _ in _RESET_DEFAULTS} - set(confspec)
+        self.assertFalse(unknown, f"Reset keys missing from confspec: {sorted(unknown)}")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,4 @@
 """Tests for cursor tracking, window monitoring debounce, and application profiles."""
-import time
 from unittest.mock import Mock, MagicMock, patch
 
 import pytest
@@ -16,12 +15,18 @@ class TestWindowMonitorDebounce:
     """Tests for WindowMonitor debounce behavior."""
 
     def _make_monitor(self, debounce_ms=100):
+        """Build a monitor whose clock only moves via self._advance()."""
         from lib.window_management import WindowMonitor
         terminal = Mock()
         pos_calc = Mock()
         monitor = WindowMonitor(terminal, pos_calc, debounce_ms=debounce_ms)
+        self._now = 1000.0
+        monitor._clock = lambda: self._now
         return monitor
 
+    def _advance(self, ms):
+        self._now += ms / 1000.0
+
     def test_window_monitor_debounce(self):
         """Rapid updates within the debounce interval should be coalesced."""
         monitor = self._make_monitor(debounce_ms=200)
@@ -33,8 +38,10 @@ class TestWindowMonitorDebounce:
         monitor.debounce_update("build", "line 2")
         monitor.debounce_update("build", "line 3")
 
-        # Only the last update should be pending (not all three)
-        assert len(announced) <= 1, "Rapid updates should be coalesced by debounce"
+        # The first update is announced; the rest coalesce into one pending
+        # entry holding only the last content.
+        assert announced == ["line 1"], "Rapid updates should be coalesced by debounce"
+        assert monitor._debounce_pending["build"][0] == "line 3"
 
     def test_window_monitor_different_content(self):
         """Different content arriving after debounce interval should be announced."""
@@ -43,11 +50,10 @@ class TestWindowMonitorDebounce:
         monitor._announce_change = lambda name, content, old: announced.append(content)
 
         monitor.debounce_update("build", "output A")
-        time.sleep(0.05)  # Wait past debounce
+        self._advance(11)  # Just past debounce
         monitor.debounce_update("build", "output B")
-        time.sleep(0.05)  # Wait past debounce
 
-        assert len(announced) >= 2, "Different content after debounce should each be announced"
+        assert announced == ["output A", "output B"], "Different content after debounce should each be announced"
 
     def test_window_monitor_same_content_suppressed(self):
         """Identical content should be suppressed even after debounce interval."""
@@ -56,9 +62,8 @@ class TestWindowMonitorDebounce:
         monitor._announce_change = lambda name, content, old: announced.append(content)
 
         monitor.debounce_update("build", "same output")
-        time.sleep(0.05)
+        self._advance(11)
         monitor.debounce_update("build", "same output")
-        time.sleep(0.05)
 
         # The second identical update should be suppressed
         assert announced.count("same output") <= 1, "Same content should not be announced twice"
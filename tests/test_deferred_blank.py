@@ -11,225 +11,199 @@ Normal (non-blank) characters and spaces are always announced immediately
 regardless of typing history.
 """
 
-import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 
-class TestBlankSuppression(unittest.TestCase):
-	"""Tests for the typing-based blank suppression mechanism."""
+# Fixed wall-clock value returned by the patched time.time()
+_NOW = 1_000_000.0
 
-	# ------------------------------------------------------------------
-	# Helpers
-	# ------------------------------------------------------------------
+# Characters at the caret that _announceStandardCursor treats as blank
+_BLANK_CHARS = ('', '\n', '\r')
 
-	def _make_plugin_with_cursor(self, char_at_caret, caret_offset=100):
-		"""
-		Build a GlobalPlugin instance whose _announceStandardCursor will
-		report *char_at_caret* for the character under the caret.
-
-		Returns (plugin, mock_obj) so tests can call
-		plugin._announceStandardCursor(mock_obj) directly.
-		"""
-		from globalPlugins.terminalAccess import GlobalPlugin
 
-		plugin = GlobalPlugin()
+class _Bookmark:
+	"""Minimal bookmark exposing the offsets _announceStandardCursor reads."""
 
-		# Ensure cache miss so the code always reads the character.
-		plugin._lastLineText = None
-		plugin._lastCaretPosition = None  # force position change detection
+	def __init__(self, startOffset, endOffset):
+		self.startOffset = startOffset
+		self.endOffset = endOffset
 
-		# Expand to UNIT_CHARACTER yields the test character.
-		def expand_side_effect(unit):
-			info_ref[0].text = char_at_caret
 
-		# Factory for makeTextInfo – each call returns a fresh MagicMock
-		# that expands to the test character.
-		info_ref = [None]  # mutable reference
+class _Info:
+	"""Plain TextInfo stub whose expand() leaves *text* unchanged."""
 
-		def make_text_info(pos):
-			info = MagicMock()
-			info.bookmark.startOffset = caret_offset
-			info.bookmark.endOffset = caret_offset + 1
-			info.expand.side_effect = expand_side_effect
-			info.text = char_at_caret
-			info_ref[0] = info
-			return info
+	def __init__(self, text, bookmark):
+		self.text = text
+		self.bookmark = bookmark
 
-		mock_obj = MagicMock()
-		mock_obj.makeTextInfo.side_effect = make_text_info
+	def expand(self, unit):
+		pass
 
-		return plugin, mock_obj
 
-	# ------------------------------------------------------------------
-	# _lastTypedCharTime initialization
-	# ------------------------------------------------------------------
+class _ObjSpec:
+	"""Spec for the terminal object mock: only makeTextInfo is consulted."""
 
-	def test_last_typed_time_initialized_zero(self):
-		"""_lastTypedCharTime must start as 0.0 (no recent typing)."""
-		from globalPlugins.terminalAccess import GlobalPlugin
+	def makeTextInfo(self, position):
+		pass
 
-		plugin = GlobalPlugin()
-		self.assertEqual(plugin._lastTypedCharTime, 0.0)
 
-	# ------------------------------------------------------------------
-	# Blank suppressed after recent typing (e.g. pressing Enter)
-	# ------------------------------------------------------------------
+class _CursorMockMixin:
+	"""Shared GlobalPlugin import and cursor-mock helpers for the TestCases below."""
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_blank_suppressed_after_recent_typing(self, mock_ui):
-		"""Blank must be suppressed when the user typed recently."""
-		plugin, mock_obj = self._make_plugin_with_cursor('')
+	@classmethod
+	def setUpClass(cls):
+		from globalPlugins.terminalAccess import GlobalPlugin
+		cls.GlobalPlugin = GlobalPlugin
 
-		# Simulate that the user just typed (e.g. pressed Enter).
-		plugin._lastTypedCharTime = time.time()
+	@classmethod
+	def _fresh_plugin(cls):
+		"""Return a GlobalPlugin with the line and caret caches cleared."""
+		plugin = cls.GlobalPlugin()
+		# Ensure cache miss so the code always reads the character.
+		plugin._lastLineText = None
+		plugin._lastCaretPosition = None  # force position change detection
+		return plugin
 
-		plugin._announceStandardCursor(mock_obj)
+	def _make_plugin_with_cursor(self, char_at_caret, caret_offset=100):
+		"""
+		Build a GlobalPlugin instance whose _announceStandardCursor will
+		report *char_at_caret* for the character under the caret.
 
-		# "Blank" must NOT be spoken.
-		mock_ui.message.assert_not_called()
+		Returns (plugin, mock_obj) so tests can call
+		plugin._announceStandardCursor(mock_obj) directly.
+		"""
+		plugin = self._fresh_plugin()
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_newline_suppressed_after_recent_typing(self, mock_ui):
-		"""Newline at caret must be suppressed when the user typed recently."""
-		plugin, mock_obj = self._make_plugin_with_cursor('\n')
+		# Every makeTextInfo call (caret and line re-read) yields the same
+		# stub; the plugin only reads from it, so one instance suffices.
+		info = _Info(char_at_caret, _Bookmark(caret_offset, caret_offset + 1))
 
-		plugin._lastTypedCharTime = time.time()
-		plugin._announceStandardCursor(mock_obj)
+		mock_obj = MagicMock(spec=_ObjSpec)
+		mock_obj.makeTextInfo.return_value = info
 
-		mock_ui.message.assert_not_called()
+		return plugin, mock_obj
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_cr_suppressed_after_recent_typing(self, mock_ui):
-		"""Carriage return at caret must be suppressed when the user typed recently."""
-		plugin, mock_obj = self._make_plugin_with_cursor('\r')
 
-		plugin._lastTypedCharTime = time.time()
-		plugin._announceStandardCursor(mock_obj)
+class TestBlankSuppression(_CursorMockMixin, unittest.TestCase):
+	"""Tests for the typing-based blank suppression mechanism."""
 
-		mock_ui.message.assert_not_called()
+	def setUp(self):
+		ui_patcher = patch('globalPlugins.terminalAccess.ui')
+		self.mock_ui = ui_patcher.start()
+		self.addCleanup(ui_patcher.stop)
+		# Spoken messages, captured in call order.
+		self.messages = []
+		self.mock_ui.message.side_effect = self.messages.append
+		time_patcher = patch('globalPlugins.terminalAccess.time.time', return_value=_NOW)
+		self.mock_time = time_patcher.start()
+		self.addCleanup(time_patcher.stop)
 
 	# ------------------------------------------------------------------
-	# Blank announced for navigation (no recent typing)
+	# Blank suppressed after recent typing (e.g. pressing Enter)
 	# ------------------------------------------------------------------
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_blank_announced_for_navigation(self, mock_ui):
-		"""Blank must be announced when there was no recent typing (navigation)."""
-		plugin, mock_obj = self._make_plugin_with_cursor('')
-
-		# _lastTypedCharTime is 0.0 (default) — long in the past.
-		plugin._announceStandardCursor(mock_obj)
+	def test_blank_variants_suppressed_after_recent_typing(self):
+		"""Empty, newline and CR at caret must be suppressed when the user typed recently."""
+		for ch in _BLANK_CHARS:
+			with self.subTest(ch=ch):
+				self.messages.clear()
+				plugin, mock_obj = self._make_plugin_with_cursor(ch)
 
-		mock_ui.message.assert_called_once()
-		args = mock_ui.message.call_args[0]
-		self.assertIn("blank", args[0].lower())
+				# Simulate that the user just typed (e.g. pressed Enter).
+				plugin._lastTypedCharTime = _NOW
+				plugin._announceStandardCursor(mock_obj)
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_newline_announced_for_navigation(self, mock_ui):
-		"""Newline at caret must announce Blank when no recent typing."""
-		plugin, mock_obj = self._make_plugin_with_cursor('\n')
-
-		plugin._announceStandardCursor(mock_obj)
+				# "Blank" must NOT be spoken.
+				self.assertEqual(self.messages, [])
 
-		mock_ui.message.assert_called_once()
-		args = mock_ui.message.call_args[0]
-		self.assertIn("blank", args[0].lower())
+	# ------------------------------------------------------------------
+	# Blank announced for navigation (no recent typing)
+	# ------------------------------------------------------------------
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_cr_announced_for_navigation(self, mock_ui):
-		"""Carriage return at caret must announce Blank when no recent typing."""
-		plugin, mock_obj = self._make_plugin_with_cursor('\r')
+	def test_blank_variants_announced_for_navigation(self):
+		"""Empty, newline and CR at caret must announce Blank when there was no recent typing."""
+		for ch in _BLANK_CHARS:
+			with self.subTest(ch=ch):
+				self.messages.clear()
+				plugin, mock_obj = self._make_plugin_with_cursor(ch)
 
-		plugin._announceStandardCursor(mock_obj)
+				# _lastTypedCharTime is 0.0 (default) — long in the past.
+				plugin._announceStandardCursor(mock_obj)
 
-		mock_ui.message.assert_called_once()
-		args = mock_ui.message.call_args[0]
-		self.assertIn("blank", args[0].lower())
+				self.assertEqual(len(self.messages), 1)
+				self.assertIn("blank", self.messages[0].lower())
 
 	# ------------------------------------------------------------------
 	# Grace period expiry — blank announced after grace period
 	# ------------------------------------------------------------------
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_blank_announced_after_grace_period(self, mock_ui):
+	def test_blank_announced_after_grace_period(self):
 		"""Blank must be announced once the typing grace period has expired."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
 		plugin, mock_obj = self._make_plugin_with_cursor('')
 
 		# Simulate typing that happened well beyond the grace period.
-		plugin._lastTypedCharTime = time.time() - (GlobalPlugin._BLANK_AFTER_TYPING_GRACE + 0.1)
+		plugin._lastTypedCharTime = _NOW - (self.GlobalPlugin._BLANK_AFTER_TYPING_GRACE + 0.1)
 
 		plugin._announceStandardCursor(mock_obj)
 
-		mock_ui.message.assert_called_once()
-		args = mock_ui.message.call_args[0]
-		self.assertIn("blank", args[0].lower())
+		self.assertEqual(len(self.messages), 1)
+		self.assertIn("blank", self.messages[0].lower())
 
 	# ------------------------------------------------------------------
 	# Normal characters always announced regardless of typing history
 	# ------------------------------------------------------------------
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_normal_char_always_announced(self, mock_ui):
+	def test_normal_char_always_announced(self):
 		"""A printable character at the caret must always be announced."""
 		plugin, mock_obj = self._make_plugin_with_cursor('a')
 
 		# Even with recent typing, normal characters are announced.
-		plugin._lastTypedCharTime = time.time()
+		plugin._lastTypedCharTime = _NOW
 		plugin._announceStandardCursor(mock_obj)
 
-		mock_ui.message.assert_called_once()
-		self.assertEqual(mock_ui.message.call_args[0][0], 'a')
+		self.assertEqual(self.messages, ['a'])
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_space_always_announced(self, mock_ui):
+	def test_space_always_announced(self):
 		"""Space at the caret must always be announced."""
 		plugin, mock_obj = self._make_plugin_with_cursor(' ')
 
-		plugin._lastTypedCharTime = time.time()
+		plugin._lastTypedCharTime = _NOW
 		plugin._announceStandardCursor(mock_obj)
 
-		mock_ui.message.assert_called_once()
+		self.assertEqual(len(self.messages), 1)
 
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_normal_char_announced_without_recent_typing(self, mock_ui):
+	def test_normal_char_announced_without_recent_typing(self):
 		"""A printable character at the caret is announced even without recent typing."""
 		plugin, mock_obj = self._make_plugin_with_cursor('x')
 
 		# _lastTypedCharTime = 0.0 (default, no recent typing).
 		plugin._announceStandardCursor(mock_obj)
 
-		mock_ui.message.assert_called_once()
-		self.assertEqual(mock_ui.message.call_args[0][0], 'x')
+		self.assertEqual(self.messages, ['x'])
 
 	# ------------------------------------------------------------------
 	# Rapid re-feeds scheduled after blank suppression
 	# ------------------------------------------------------------------
 
 	@patch('globalPlugins.terminalAccess.wx')
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_rapid_refeeds_scheduled_after_suppression(self, mock_ui, mock_wx):
+	def test_rapid_refeeds_scheduled_after_suppression(self, mock_wx):
 		"""When blank is suppressed, rapid re-feeds must be scheduled."""
 		plugin, mock_obj = self._make_plugin_with_cursor('')
 
 		# Simulate recent typing.
-		plugin._lastTypedCharTime = time.time()
+		plugin._lastTypedCharTime = _NOW
 		plugin._announceStandardCursor(mock_obj)
 
 		# Blank must NOT be spoken.
-		mock_ui.message.assert_not_called()
+		self.assertEqual(self.messages, [])
 
-		# wx.CallLater must have been called twice (50ms and 150ms re-feeds).
-		self.assertEqual(mock_wx.CallLater.call_count, 2)
+		# wx.CallLater must have been called once per re-feed delay.
 		delays = [call[0][0] for call in mock_wx.CallLater.call_args_list]
-		self.assertIn(50, delays)
-		self.assertIn(150, delays)
+		self.assertEqual(delays, [50, 150])
 
 	@patch('globalPlugins.terminalAccess.wx')
-	@patch('globalPlugins.terminalAccess.ui')
-	def test_no_refeeds_for_navigation_blank(self, mock_ui, mock_wx):
+	def test_no_refeeds_for_navigation_blank(self, mock_wx):
 		"""Navigation-triggered blanks must NOT schedule re-feeds."""
 		plugin, mock_obj = self._make_plugin_with_cursor('')
 
@@ -238,31 +212,46 @@ class TestBlankSuppression(unittest.TestCase):
 		plugin._announceStandardCursor(mock_obj)
 
 		# "Blank" must be spoken.
-		mock_ui.message.assert_called_once()
+		self.assertEqual(len(self.messages), 1)
 
 		# No re-feeds should be scheduled for navigation blanks.
 		mock_wx.CallLater.assert_not_called()
 
+
+class TestBlankSuppressionConstants(_CursorMockMixin, unittest.TestCase):
+	"""Initial state and constants that need no cursor or ui mocking."""
+
+	# ------------------------------------------------------------------
+	# _lastTypedCharTime initialization
+	# ------------------------------------------------------------------
+
+	def test_last_typed_time_initialized_zero(self):
+		"""_lastTypedCharTime must start as 0.0 (no recent typing)."""
+		plugin = self.GlobalPlugin()
+		self.assertEqual(plugin._lastTypedCharTime, 0.0)
+
 	# ------------------------------------------------------------------
 	# Grace period constant
 	# ------------------------------------------------------------------
 
 	def test_grace_period_is_reasonable(self):
 		"""The grace period should be between 0.05 and 2.0 seconds."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		grace = GlobalPlugin._BLANK_AFTER_TYPING_GRACE
+		grace = self.GlobalPlugin._BLANK_AFTER_TYPING_GRACE
 		self.assertGreaterEqual(grace, 0.05)
 		self.assertLessEqual(grace, 2.0)
 
 	def test_grace_period_is_short(self):
 		"""The grace period should be short enough to avoid noticeable delay."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		grace = GlobalPlugin._BLANK_AFTER_TYPING_GRACE
+		grace = self.GlobalPlugin._BLANK_AFTER_TYPING_GRACE
 		# Must be under 300ms to keep output responsive
 		self.assertLessEqual(grace, 0.3)
 
+	def test_refeed_delays_are_increasing(self):
+		"""Re-feeds should be scheduled at increasing, sub-second delays."""
+		delays = self.GlobalPlugin._BLANK_REFEED_DELAYS
+		self.assertEqual(list(delays), sorted(set(delays)))
+		self.assertLess(delays[-1], 1000)
+
 
 if __name__ == '__main__':
 	unittest.main()
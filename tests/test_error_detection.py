@@ -482,16 +482,15 @@ class TestErrorCueContextBehavior:
 			obj._reportNewLines(["warning: deprecated function"])
 			mock_tones.beep.assert_called_once_with(440, 30)
 
-	def test_quiet_mode_normal_line_no_beep(self):
+	def test_quiet_mode_normal_line_no_beep(self, conf):
 		"""In quiet mode, normal lines should produce no beep."""
 		import tones
-		import config as config_mod
 		tones.beep = MagicMock()
 
 		plugin = self._make_plugin()
-		config_mod.conf["terminalAccess"]["quietMode"] = True
-		config_mod.conf["terminalAccess"]["errorAudioCuesInQuietMode"] = True
-		config_mod.conf["terminalAccess"]["errorAudioCues"] = True
+		conf["quietMode"] = True
+		conf["errorAudioCuesInQuietMode"] = True
+		conf["errorAudioCues"] = True
 
 		obj = self._make_terminal_obj("total 42")
 		plugin._boundTerminal = obj
@@ -551,15 +550,14 @@ class TestOutputActivityTones:
 			second = mock_tones.beep.call_args_list[1][0][0]
 			assert first < second
 
-	def test_no_activity_tone_when_setting_disabled(self):
+	def test_no_activity_tone_when_setting_disabled(self, conf):
 		"""No activity tones when outputActivityTones is False."""
 		import tones
-		import config as config_mod
 		tones.beep = MagicMock()
 
 		plugin = self._make_plugin()
-		config_mod.conf["terminalAccess"]["outputActivityTones"] = False
-		config_mod.conf["terminalAccess"]["quietMode"] = True
+		conf["outputActivityTones"] = False
+		conf["quietMode"] = True
 
 		obj = self._make_terminal_obj()
 		plugin._boundTerminal = obj
@@ -570,16 +568,15 @@ class TestOutputActivityTones:
 
 		tones.beep.assert_not_called()
 
-	def test_no_activity_tone_during_typing(self):
+	def test_no_activity_tone_during_typing(self, conf):
 		"""Activity tones should not play when user is typing (echo, not output)."""
 		import tones
 		import time
-		import config as config_mod
 		tones.beep = MagicMock()
 
 		plugin = self._make_plugin()
-		config_mod.conf["terminalAccess"]["outputActivityTones"] = True
-		config_mod.conf["terminalAccess"]["quietMode"] = True
+		conf["outputActivityTones"] = True
+		conf["quietMode"] = True
 
 		obj = self._make_terminal_obj()
 		plugin._boundTerminal = obj
@@ -618,15 +615,14 @@ class TestOutputActivityTones:
 			obj.event_textChange()
 			mock_tones.beep.assert_not_called()
 
-	def test_activity_tones_distinct_from_error(self):
+	def test_activity_tones_distinct_from_error(self, conf):
 		"""Activity tones must use different frequencies than error/warning."""
 		import tones
-		import config as config_mod
 		tones.beep = MagicMock()
 
 		plugin = self._make_plugin()
-		config_mod.conf["terminalAccess"]["outputActivityTones"] = True
-		config_mod.conf["terminalAccess"]["quietMode"] = True
+		conf["outputActivityTones"] = True
+		conf["quietMode"] = True
 
 		obj = self._make_terminal_obj()
 		plugin._boundTerminal = obj
@@ -5,37 +5,84 @@ Tests cover gesture registration, conflict detection, help descriptions,
 and the command layer (modal single-key command mode).
 """
 
+import functools
 import unittest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import MagicMock, patch
 import sys
 
+from globalPlugins.terminalAccess import (
+	GlobalPlugin,
+	SCRCAT_TERMINALACCESS,
+	_COMMAND_LAYER_MAP,
+	_DEFAULT_GESTURES,
+)
+
+
+# Common NVDA core gestures Terminal Access must not shadow
+_NVDA_CORE_GESTURES = frozenset({
+	'kb:NVDA+upArrow',
+	'kb:NVDA+downArrow',
+	'kb:NVDA+leftArrow',
+	'kb:NVDA+rightArrow',
+	'kb:NVDA+control+upArrow',
+	'kb:NVDA+control+downArrow',
+	'kb:NVDA+tab',
+	'kb:NVDA+shift+tab',
+})
+
+# Scripts that intentionally skip the isTerminalApp guard:
+# - showHelp: always available (in _ALWAYS_BOUND)
+# - copyLine/copyScreen/exitCopyMode: guarded by self.copyMode
+# - exitCommandLayer: guarded by self._inCommandLayer
+_ALWAYS_ACTIVE_SCRIPTS = frozenset({
+	'script_showHelp',
+	'script_copyLine', 'script_copyScreen', 'script_exitCopyMode',
+	'script_exitCommandLayer',
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _script_methods():
+	"""Return GlobalPlugin's script_* functions keyed by name, computed once.
+
+	Reads the class __dict__ directly: every script is defined on
+	GlobalPlugin itself, so no MRO walk or sort is needed.
+	"""
+	return {
+		name: obj for name, obj in vars(GlobalPlugin).items()
+		if name.startswith('script_')
+	}
+
 
 class TestGestureRegistration(unittest.TestCase):
 	"""Test gesture registration and configuration."""
 
-	def test_no_gesture_conflicts(self):
-		"""Test no conflicts with NVDA core gestures."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		# Common NVDA core gestures we should avoid
-		nvda_core_gestures = {
-			'kb:NVDA+upArrow',
-			'kb:NVDA+downArrow',
-			'kb:NVDA+leftArrow',
-			'kb:NVDA+rightArrow',
-			'kb:NVDA+control+upArrow',
-			'kb:NVDA+control+downArrow',
-			'kb:NVDA+tab',
-			'kb:NVDA+shift+tab',
+	@classmethod
+	def setUpClass(cls):
+		# GlobalPlugin declares its map as the name-mangled ``__gestures``
+		# attribute that NVDA's ScriptableObject reads.
+		cls.gestures = getattr(GlobalPlugin, '_GlobalPlugin__gestures', {})
+		cls.script_methods = frozenset(_script_methods())
+
+	def test_class_gesture_map_populated(self):
+		"""The class-level gesture map must be found and non-empty."""
+		self.assertTrue(self.gestures)
+
+	def test_gesture_bindings_exist(self):
+		"""Every class-level gesture must map to an existing script."""
+		unresolved = {
+			gesture_id: name for gesture_id, name in self.gestures.items()
+			if f"script_{name}" not in self.script_methods
 		}
+		self.assertFalse(unresolved,
+			f"Gestures bound to missing scripts: {unresolved}")
 
-		if hasattr(GlobalPlugin, '__gestures__'):
-			plugin_gestures = set(GlobalPlugin.__gestures__.keys())
-
-			# Check for conflicts
-			conflicts = plugin_gestures.intersection(nvda_core_gestures)
-			self.assertEqual(len(conflicts), 0,
-				f"Gesture conflicts detected: {conflicts}")
+	def test_no_gesture_conflicts(self):
+		"""Test no conflicts with NVDA core gestures."""
+		# Only build the intersection for the failure message.
+		if not self.gestures.keys().isdisjoint(_NVDA_CORE_GESTURES):
+			self.fail(f"Gesture conflicts detected: "
+				f"{sorted(self.gestures.keys() & _NVDA_CORE_GESTURES)}")
 
 
 class TestGestureDocumentation(unittest.TestCase):
@@ -43,23 +90,14 @@ class TestGestureDocumentation(unittest.TestCase):
 
 	def test_gesture_help_descriptions(self):
 		"""Test all gestures have help descriptions."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		# Get all script methods
-		for attr_name in dir(GlobalPlugin):
-			if attr_name.startswith('script_'):
-				method = getattr(GlobalPlugin, attr_name)
-
-				# Check if method has __doc__ or __func__.__doc__
-				has_doc = (
-					(hasattr(method, '__doc__') and method.__doc__ is not None) or
-					(hasattr(method, '__func__') and
-					 hasattr(method.__func__, '__doc__') and
-					 method.__func__.__doc__ is not None)
-				)
-
-				self.assertTrue(has_doc,
-					f"Script {attr_name} missing docstring")
+		# A script is documented if it or its __func__ carries a docstring
+		undocumented = {
+			attr_name for attr_name, method in _script_methods().items()
+			if getattr(method, '__doc__', None) is None
+			and getattr(getattr(method, '__func__', None), '__doc__', None) is None
+		}
+		self.assertFalse(undocumented,
+			f"Scripts missing docstrings: {sorted(undocumented)}")
 
 
 class TestGestureBindingsVisibility(unittest.TestCase):
@@ -72,8 +110,6 @@ class TestGestureBindingsVisibility(unittest.TestCase):
 
 	def test_all_gestures_bound_at_init(self):
 		"""All gestures are bound at init so they appear in Input Gestures dialog."""
-		from globalPlugins.terminalAccess import GlobalPlugin, _DEFAULT_GESTURES
-
 		plugin = GlobalPlugin()
 
 		gesture_map = getattr(plugin, '_gestureMap', {})
@@ -85,7 +121,6 @@ class TestGestureBindingsVisibility(unittest.TestCase):
 	def test_excluded_gesture_removed_others_remain(self):
 		"""Only user-excluded gestures should be removed."""
 		import config as config_mod
-		from globalPlugins.terminalAccess import GlobalPlugin, _DEFAULT_GESTURES, _ALWAYS_BOUND
 
 		config_mod.conf["terminalAccess"]["unboundGestures"] = "kb:NVDA+u"
 
@@ -108,25 +143,10 @@ class TestGestureBindingsVisibility(unittest.TestCase):
 		This guard is what makes gestures safe to keep always-bound — they
 		pass through when not in a terminal.
 		"""
-		from globalPlugins.terminalAccess import GlobalPlugin
 		import inspect
 
-		# Scripts that intentionally skip the isTerminalApp guard:
-		# - showHelp: always available (in _ALWAYS_BOUND)
-		# - copyLine/copyScreen/exitCopyMode: guarded by self.copyMode
-		# - exitCommandLayer: guarded by self._inCommandLayer
-		always_active = {
-			'script_showHelp',
-			'script_copyLine', 'script_copyScreen', 'script_exitCopyMode',
-			'script_exitCommandLayer',
-		}
-
-		for attr_name in dir(GlobalPlugin):
-			if not attr_name.startswith('script_'):
-				continue
-			if attr_name in always_active:
-				continue
-			method = getattr(GlobalPlugin, attr_name)
+		for attr_name in sorted(_script_methods().keys() - _ALWAYS_ACTIVE_SCRIPTS):
+			method = _script_methods()[attr_name]
 			if not callable(method):
 				continue
 			source = inspect.getsource(method)
@@ -138,11 +158,28 @@ class TestGestureBindingsVisibility(unittest.TestCase):
 class TestGestureExecution(unittest.TestCase):
 	"""Test gesture execution and behavior."""
 
+	@classmethod
+	def setUpClass(cls):
+		# Bind the module as it is when this class runs, not at file import:
+		# another test file may have re-imported globalPlugins.terminalAccess,
+		# and ui must be patched on the module GlobalPlugin actually uses.
+		from globalPlugins import terminalAccess
+		cls.terminalAccess = terminalAccess
+
+	def setUp(self):
+		# Fresh ui mock per test so message assertions can't be satisfied
+		# by calls made in earlier tests; patch.dict restores sys.modules.
+		self.mock_ui = MagicMock()
+		modules_patcher = patch.dict(sys.modules, {'ui': self.mock_ui})
+		modules_patcher.start()
+		self.addCleanup(modules_patcher.stop)
+		ui_patcher = patch.object(self.terminalAccess, 'ui', self.mock_ui)
+		ui_patcher.start()
+		self.addCleanup(ui_patcher.stop)
+
 	def test_readCurrentLine_calls_review(self):
 		"""script_readCurrentLine should delegate to NVDA review on terminal."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		plugin = GlobalPlugin()
+		plugin = self.terminalAccess.GlobalPlugin()
 		plugin.isTerminalApp = MagicMock(return_value=True)
 		gesture = MagicMock()
 		# Should not raise — delegates to globalCommands
@@ -152,9 +189,8 @@ class TestGestureExecution(unittest.TestCase):
 	def test_toggleQuietMode_flips_config(self):
 		"""script_toggleQuietMode should toggle the quietMode setting."""
 		import config as config_mod
-		from globalPlugins.terminalAccess import GlobalPlugin
 
-		plugin = GlobalPlugin()
+		plugin = self.terminalAccess.GlobalPlugin()
 		plugin.isTerminalApp = MagicMock(return_value=True)
 		gesture = MagicMock()
 
@@ -166,9 +202,7 @@ class TestGestureExecution(unittest.TestCase):
 
 	def test_script_sends_gesture_when_not_terminal(self):
 		"""Scripts should pass gesture through when not in terminal."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		plugin = GlobalPlugin()
+		plugin = self.terminalAccess.GlobalPlugin()
 		plugin.isTerminalApp = MagicMock(return_value=False)
 		gesture = MagicMock()
 
@@ -177,9 +211,7 @@ class TestGestureExecution(unittest.TestCase):
 
 	def test_announcePosition_speaks(self):
 		"""script_announcePosition should call ui.message."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		plugin = GlobalPlugin()
+		plugin = self.terminalAccess.GlobalPlugin()
 		plugin.isTerminalApp = MagicMock(return_value=True)
 		plugin._boundTerminal = MagicMock()
 		gesture = MagicMock()
@@ -189,22 +221,18 @@ class TestGestureExecution(unittest.TestCase):
 		plugin._positionCalculator.calculate = MagicMock(return_value=(5, 10))
 
 		plugin.script_announcePosition(gesture)
-		ui_mock = sys.modules['ui']
-		ui_mock.message.assert_called()
+		self.mock_ui.message.assert_called()
 
 	def test_copyLinearSelection_no_marks_warns(self):
 		"""Copying without marks should produce a warning message."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
-		plugin = GlobalPlugin()
+		plugin = self.terminalAccess.GlobalPlugin()
 		plugin.isTerminalApp = MagicMock(return_value=True)
 		plugin._markStart = None
 		plugin._markEnd = None
 		gesture = MagicMock()
 
 		plugin.script_copyLinearSelection(gesture)
-		ui_mock = sys.modules['ui']
-		ui_mock.message.assert_called()
+		self.mock_ui.message.assert_called()
 
 
 class TestGestureScoping(unittest.TestCase):
@@ -218,8 +246,6 @@ class TestGestureScoping(unittest.TestCase):
 
 	def test_gestures_stay_bound_after_focus_loss(self):
 		"""Gestures stay in _gestureMap after focus loss (for Input Gestures dialog)."""
-		from globalPlugins.terminalAccess import GlobalPlugin, _DEFAULT_GESTURES
-
 		plugin = GlobalPlugin()
 
 		non_terminal = MagicMock()
@@ -227,14 +253,12 @@ class TestGestureScoping(unittest.TestCase):
 		non_terminal.appModule.appName = "notepad"
 		plugin._updateGestureBindingsForFocus(non_terminal)
 
-		gesture_map = plugin._gestureMap
-		for gesture in _DEFAULT_GESTURES:
-			self.assertIn(gesture, gesture_map)
+		missing = set(_DEFAULT_GESTURES) - set(plugin._gestureMap)
+		self.assertFalse(missing,
+			f"Gestures unbound after focus loss: {sorted(missing)}")
 
 	def test_getScript_blocks_terminal_gestures_outside_terminal(self):
 		"""getScript returns None for terminal gestures when no terminal focused."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
 		plugin = GlobalPlugin()
 		plugin._boundTerminal = None
 
@@ -246,8 +270,6 @@ class TestGestureScoping(unittest.TestCase):
 
 	def test_focus_loss_exits_command_layer(self):
 		"""Switching to non-terminal exits command layer."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
 		plugin = GlobalPlugin()
 		plugin._inCommandLayer = True
 
@@ -260,8 +282,6 @@ class TestGestureScoping(unittest.TestCase):
 
 	def test_focus_loss_exits_copy_mode(self):
 		"""Switching to non-terminal exits copy mode."""
-		from globalPlugins.terminalAccess import GlobalPlugin
-
 		plugin = GlobalPlugin()
 		plugin.copyMode = True
 
@@ -282,52 +302,47 @@ class TestCommandLayerMap(unittest.TestCase):
 
 	def test_map_is_non_empty(self):
 		"""The command layer map must define at least one binding."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		self.assertGreater(len(_COMMAND_LAYER_MAP), 0)
 
 	def test_all_keys_are_gesture_strings(self):
 		"""Every key must start with 'kb:'."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		for gesture_id in _COMMAND_LAYER_MAP:
 			self.assertTrue(gesture_id.startswith("kb:"),
 				f"Gesture key {gesture_id!r} does not start with 'kb:'")
 
 	def test_all_values_are_script_names(self):
 		"""Every value must correspond to a real script_ method."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP, GlobalPlugin
-		for gesture_id, script_name in _COMMAND_LAYER_MAP.items():
-			method_name = f"script_{script_name}"
-			self.assertTrue(hasattr(GlobalPlugin, method_name),
-				f"Layer maps {gesture_id!r} -> {script_name!r} but "
-				f"GlobalPlugin has no method {method_name}")
+		scripts = _script_methods()
+		unresolved = {
+			gesture_id: script_name
+			for gesture_id, script_name in _COMMAND_LAYER_MAP.items()
+			if f"script_{script_name}" not in scripts
+		}
+		self.assertFalse(unresolved,
+			f"Layer gestures map to missing GlobalPlugin scripts: {unresolved}")
 
 	def test_escape_maps_to_exit(self):
 		"""Escape key must map to exitCommandLayer."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		self.assertEqual(_COMMAND_LAYER_MAP.get("kb:escape"), "exitCommandLayer")
 
 	def test_no_nvda_modifier_keys(self):
 		"""Layer keys must not require the NVDA modifier."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		for gesture_id in _COMMAND_LAYER_MAP:
 			self.assertNotIn("NVDA", gesture_id,
 				f"Layer gesture {gesture_id!r} should not use NVDA modifier")
 
 	def test_bookmark_digit_coverage(self):
 		"""All 10 digits (0-9) should be mapped for jump and set."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
-		for d in range(10):
-			self.assertIn(f"kb:{d}", _COMMAND_LAYER_MAP,
-				f"Jump-to-bookmark digit {d} missing from layer map")
-			self.assertIn(f"kb:shift+{d}", _COMMAND_LAYER_MAP,
-				f"Set-bookmark digit {d} missing from layer map")
+		expected = {f"kb:{d}" for d in range(10)} | {f"kb:shift+{d}" for d in range(10)}
+		missing = expected - set(_COMMAND_LAYER_MAP)
+		self.assertFalse(missing,
+			f"Bookmark digits missing from layer map: {sorted(missing)}")
 
 
 class TestCommandLayerEntryExit(unittest.TestCase):
 	"""Test entering and exiting the command layer."""
 
 	def setUp(self):
-		from globalPlugins.terminalAccess import GlobalPlugin
 		self.plugin = GlobalPlugin()
 		# Ensure the plugin thinks we're in a terminal context
 		self.plugin.isTerminalApp = MagicMock(return_value=True)
@@ -343,7 +358,6 @@ class TestCommandLayerEntryExit(unittest.TestCase):
 
 	def test_enter_layer_binds_gestures(self):
 		"""Entering the layer calls bindGesture for every key in the map."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		self.plugin._enterCommandLayer()
 		self.assertEqual(self.plugin.bindGesture.call_count,
 			len(_COMMAND_LAYER_MAP))
@@ -356,7 +370,6 @@ class TestCommandLayerEntryExit(unittest.TestCase):
 
 	def test_exit_layer_unbinds_gestures(self):
 		"""Exiting the layer calls removeGestureBinding for every key."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		self.plugin._inCommandLayer = True
 		self.plugin._exitCommandLayer()
 		self.assertEqual(self.plugin.removeGestureBinding.call_count,
@@ -430,7 +443,6 @@ class TestCommandLayerFocusLoss(unittest.TestCase):
 	"""Test that the command layer auto-exits when terminal loses focus."""
 
 	def setUp(self):
-		from globalPlugins.terminalAccess import GlobalPlugin
 		self.plugin = GlobalPlugin()
 		self.plugin.isTerminalApp = MagicMock(return_value=True)
 		self.plugin.bindGesture = MagicMock()
@@ -468,7 +480,6 @@ class TestCommandLayerCopyModeInteraction(unittest.TestCase):
 	"""Test interaction between command layer and copy mode."""
 
 	def setUp(self):
-		from globalPlugins.terminalAccess import GlobalPlugin
 		self.plugin = GlobalPlugin()
 		self.plugin.isTerminalApp = MagicMock(return_value=True)
 		self.plugin.bindGesture = MagicMock()
@@ -484,7 +495,6 @@ class TestCommandLayerCopyModeInteraction(unittest.TestCase):
 
 	def test_exit_copy_mode_restores_layer_bindings(self):
 		"""Exiting copy mode while in layer re-binds layer keys (l, s, escape)."""
-		from globalPlugins.terminalAccess import _COMMAND_LAYER_MAP
 		# Simulate being in the command layer
 		self.plugin._inCommandLayer = True
 		self.plugin.copyMode = True
@@ -515,12 +525,7 @@ class TestCommandLayerCategory(unittest.TestCase):
 
 	def test_all_scripts_have_category(self):
 		"""Every script should have the SCRCAT_TERMINALACCESS category."""
-		from globalPlugins.terminalAccess import GlobalPlugin, SCRCAT_TERMINALACCESS
-
-		for attr_name in dir(GlobalPlugin):
-			if not attr_name.startswith('script_'):
-				continue
-			method = getattr(GlobalPlugin, attr_name)
+		for attr_name, method in sorted(_script_methods().items()):
 			# Some scripts use scriptHandler.script decorator which sets
 			# _script_category; others set it via the @script decorator.
 			category = getattr(method, 'category', None)
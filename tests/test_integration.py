@@ -4,18 +4,45 @@ Integration tests for core Terminal Access workflows.
 Tests complete user workflows and feature interactions.
 """
 import unittest
+from dataclasses import dataclass
 from unittest.mock import Mock, patch, MagicMock
 import sys
 
+from globalPlugins.terminalAccess import BookmarkManager, GlobalPlugin, ProfileManager
 
-class TestPositionCalculation(unittest.TestCase):
+
+@dataclass
+class _TextInfoStub:
+    """TextInfo stand-in exposing the attributes PositionCalculator reads."""
+
+    text: str
+    bookmark: object = None
+
+
+class _SharedPluginTestCase(unittest.TestCase):
+    """Base TestCase that builds one GlobalPlugin per class.
+
+    GlobalPlugin.__init__ sets up managers, caches and config sanitization,
+    so classes whose tests only read plugin state share a single instance.
+    Subclasses reset any state their tests mutate in setUp.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.plugin = GlobalPlugin()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.plugin.terminate()
+
+
+class TestPositionCalculation(_SharedPluginTestCase):
     """Test position calculation methods using PositionCalculator."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
+        """Reset the bound terminal and position cache."""
+        self.plugin._boundTerminal = None
+        self.plugin._positionCalculator.clear_cache()
 
     def test_position_calculator_exists(self):
         """Test PositionCalculator is initialized."""
@@ -23,10 +50,10 @@ class TestPositionCalculation(unittest.TestCase):
 
     def test_position_calculator_calculate_no_terminal(self):
         """Test calculate with no bound terminal."""
-        mock_textinfo = Mock()
+        textinfo = _TextInfoStub("", "test_bookmark")
         self.plugin._boundTerminal = None
 
-        result = self.plugin._positionCalculator.calculate(mock_textinfo, None)
+        result = self.plugin._positionCalculator.calculate(textinfo, None)
         self.assertIsInstance(result, tuple)
         self.assertEqual(len(result), 2)
 
@@ -52,38 +79,35 @@ class TestPositionCalculation(unittest.TestCase):
         self.assertIsNone(result)
 
 
-class TestCursorTracking(unittest.TestCase):
-    """Test cursor tracking functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
-    def test_cursor_tracking_timer_initialization(self):
-        """Test cursor tracking timer is initialized."""
-        self.assertIsNone(self.plugin._cursorTrackingTimer)
-
-    def test_last_caret_position_initialization(self):
-        """Test last caret position is initialized."""
-        self.assertIsNone(self.plugin._lastCaretPosition)
-
-    def test_cursor_tracking_state_variables(self):
-        """Test cursor tracking state variables exist."""
-        self.assertTrue(hasattr(self.plugin, '_cursorTrackingTimer'))
-        self.assertTrue(hasattr(self.plugin, '_lastCaretPosition'))
-
-
-class TestWindowOperations(unittest.TestCase):
+class TestInitialPluginState(_SharedPluginTestCase):
+    """Test manager and state attributes of a freshly built plugin."""
+
+    # (attribute, expected to start as None)
+    _INITIAL_STATE = (
+        ('_configManager', False),
+        ('_windowManager', False),
+        ('_positionCalculator', False),
+        ('_profileManager', False),
+        ('_boundTerminal', False),
+        ('_cursorTrackingTimer', True),
+        ('_lastCaretPosition', True),
+        ('_markStart', True),
+        ('_markEnd', True),
+        ('_backgroundCalculationThread', True),
+    )
+
+    def test_initial_attributes(self):
+        """Test required attributes exist and state starts cleared."""
+        for attr, expected_none in self._INITIAL_STATE:
+            with self.subTest(attr=attr):
+                self.assertTrue(hasattr(self.plugin, attr))
+                if expected_none:
+                    self.assertIsNone(getattr(self.plugin, attr))
+
+
+class TestWindowOperations(_SharedPluginTestCase):
     """Test window definition and tracking operations using WindowManager."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
     def test_window_manager_initialization(self):
         """Test WindowManager is initialized."""
         self.assertIsNotNone(self.plugin._windowManager)
@@ -98,19 +122,13 @@ class TestWindowOperations(unittest.TestCase):
         self.assertTrue(hasattr(self.plugin._windowManager, 'disable_window'))
 
 
-class TestSelectionWorkflow(unittest.TestCase):
+class TestSelectionWorkflow(_SharedPluginTestCase):
     """Test complete selection workflow."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
-    def test_mark_state_initialization(self):
-        """Test selection marks are initialized to None."""
-        self.assertIsNone(self.plugin._markStart)
-        self.assertIsNone(self.plugin._markEnd)
+        """Clear any marks left by a previous test."""
+        self.plugin._markStart = None
+        self.plugin._markEnd = None
 
     def test_mark_state_workflow(self):
         """Test mark state can be set and cleared."""
@@ -128,20 +146,10 @@ class TestSelectionWorkflow(unittest.TestCase):
         self.assertIsNone(self.plugin._markStart)
         self.assertIsNone(self.plugin._markEnd)
 
-    def test_background_thread_initialization(self):
-        """Test background calculation thread is initialized."""
-        self.assertIsNone(self.plugin._backgroundCalculationThread)
 
-
-class TestClipboardOperations(unittest.TestCase):
+class TestClipboardOperations(_SharedPluginTestCase):
     """Test clipboard copy operations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
     def test_copy_to_clipboard_exists(self):
         """Test _copyToClipboard method exists."""
         self.assertTrue(hasattr(self.plugin, '_copyToClipboard'))
@@ -149,8 +157,7 @@ class TestClipboardOperations(unittest.TestCase):
 
     def test_copy_to_clipboard_with_empty_text(self):
         """Test _copyToClipboard with empty text still calls api.copyToClip."""
-        with patch('api.copyToClip') as mock_copy:
-            mock_copy.return_value = True
+        with patch('api.copyToClip', return_value=True) as mock_copy:
             result = self.plugin._copyToClipboard("")
             # Even with empty text, it should try to copy and return result
             self.assertTrue(result)
@@ -158,8 +165,7 @@ class TestClipboardOperations(unittest.TestCase):
 
     def test_copy_to_clipboard_with_valid_text(self):
         """Test _copyToClipboard with valid text."""
-        with patch('api.copyToClip') as mock_copy:
-            mock_copy.return_value = True
+        with patch('api.copyToClip', return_value=True) as mock_copy:
             result = self.plugin._copyToClipboard("test text")
             self.assertTrue(result)
             # Check that it was called with notify=False parameter
@@ -171,47 +177,19 @@ class TestPluginLifecycle(unittest.TestCase):
 
     def test_plugin_initialization(self):
         """Test plugin initializes without errors."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
-            self.assertIsNotNone(plugin)
-
-    def test_plugin_has_required_attributes(self):
-        """Test plugin has all required manager classes and attributes."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            plugin = GlobalPlugin()
-
-            # Manager classes (new architecture)
-            self.assertTrue(hasattr(plugin, '_configManager'))
-            self.assertTrue(hasattr(plugin, '_windowManager'))
-            self.assertTrue(hasattr(plugin, '_positionCalculator'))
-            self.assertTrue(hasattr(plugin, '_profileManager'))
-
-            # State variables
-            self.assertTrue(hasattr(plugin, '_boundTerminal'))
-            self.assertTrue(hasattr(plugin, '_markStart'))
-            self.assertTrue(hasattr(plugin, '_markEnd'))
-            self.assertTrue(hasattr(plugin, '_lastCaretPosition'))
+        plugin = GlobalPlugin()
+        self.assertIsNotNone(plugin)
 
     def test_plugin_terminate(self):
         """Test plugin terminates without errors."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog') as mock_dialog:
-            plugin = GlobalPlugin()
-            # Should not raise any errors
-            plugin.terminate()
+        plugin = GlobalPlugin()
+        # Should not raise any errors
+        plugin.terminate()
 
 
-class TestConfigurationIntegration(unittest.TestCase):
+class TestConfigurationIntegration(_SharedPluginTestCase):
     """Test configuration integration with plugin."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
     def test_config_sanitization_called(self):
         """Test _sanitizeConfig is called during init."""
         # Plugin should have sanitized config
@@ -225,39 +203,18 @@ class TestConfigurationIntegration(unittest.TestCase):
         self.assertLessEqual(conf["punctuationLevel"], 3)
 
 
-class TestPerformanceOptimizations(unittest.TestCase):
+class TestPerformanceOptimizations(_SharedPluginTestCase):
     """Test performance optimization features using PositionCalculator."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
     def test_position_calculator_has_cache(self):
         """Test PositionCalculator has a cache."""
         self.assertIsNotNone(self.plugin._positionCalculator)
         self.assertTrue(hasattr(self.plugin._positionCalculator, '_cache'))
 
-    def test_last_caret_position_tracking(self):
-        """Test last caret position tracking exists."""
-        self.assertIsNone(self.plugin._lastCaretPosition)
-        self.assertTrue(hasattr(self.plugin, '_lastCaretPosition'))
 
-    def test_background_calculation_thread_exists(self):
-        """Test background calculation thread attribute exists."""
-        self.assertTrue(hasattr(self.plugin, '_backgroundCalculationThread'))
-
-
-class TestErrorRecovery(unittest.TestCase):
+class TestErrorRecovery(_SharedPluginTestCase):
     """Test error handling and recovery."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
-
     def test_calculate_position_handles_none_textinfo(self):
         """Test _calculatePosition handles None textinfo gracefully."""
         # Should not raise exception
@@ -280,7 +237,6 @@ class TestMultiStepWorkflows(unittest.TestCase):
     """Test complete multi-step user workflows."""
 
     def setUp(self):
-        from globalPlugins.terminalAccess import GlobalPlugin
         self.plugin = GlobalPlugin()
         self.plugin.isTerminalApp = Mock(return_value=True)
         self.plugin._boundTerminal = Mock()
@@ -358,7 +314,6 @@ class TestErrorPropagation(unittest.TestCase):
     """Test error handling in edge cases."""
 
     def setUp(self):
-        from globalPlugins.terminalAccess import GlobalPlugin
         self.plugin = GlobalPlugin()
         self.plugin.isTerminalApp = Mock(return_value=True)
         self.plugin._boundTerminal = Mock()
@@ -386,7 +341,6 @@ class TestErrorPropagation(unittest.TestCase):
 
     def test_bookmark_jump_invalid_index(self):
         """Jumping to an unset bookmark doesn't crash."""
-        from globalPlugins.terminalAccess import BookmarkManager
         terminal = Mock()
         bm = BookmarkManager(terminal)
         # No bookmarks set — jump should return falsy (not crash)
@@ -395,7 +349,6 @@ class TestErrorPropagation(unittest.TestCase):
 
     def test_isTerminalApp_handles_missing_appName(self):
         """isTerminalApp returns False when appName is not a string."""
-        from globalPlugins.terminalAccess import GlobalPlugin
         plugin = GlobalPlugin()  # Fresh plugin without mocked isTerminalApp
         broken = Mock()
         broken.appModule.appName = None
@@ -404,7 +357,6 @@ class TestErrorPropagation(unittest.TestCase):
 
     def test_profile_manager_detect_unknown_app(self):
         """ProfileManager.detectApplication handles unknown apps."""
-        from globalPlugins.terminalAccess import ProfileManager
         mgr = ProfileManager()
         mock_obj = Mock()
         mock_obj.appModule.appName = "unknown_app_xyz"
@@ -1,8 +1,15 @@
 """Tests for output search behavior."""
 
+from unittest.mock import patch
+
 import api
+import pytest
 import textInfos
 
+import lib._runtime as _rt
+from globalPlugins.terminalAccess import OutputSearchManager
+from lib.search import _find_line_matches
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -43,8 +50,9 @@ class DummyTerminal:
 		raise ValueError("Bookmarks not supported")
 
 
-def _setup_textinfos():
-	"""Ensure textInfos constants are set."""
+@pytest.fixture(scope="module", autouse=True)
+def _textinfos_constants():
+	"""Give the textInfos mock plain position/unit constants once per module."""
 	textInfos.POSITION_ALL = "all"
 	textInfos.POSITION_FIRST = "first"
 	textInfos.UNIT_LINE = "line"
@@ -56,10 +64,6 @@ def _setup_textinfos():
 
 def test_search_moves_review_without_bookmarks():
 	"""Ensure search moves the review cursor even when bookmarks aren't supported."""
-	_setup_textinfos()
-
-	from globalPlugins.terminalAccess import OutputSearchManager
-
 	api.setReviewPosition.reset_mock()
 
 	manager = OutputSearchManager(DummyTerminal("alpha\nbeta\ngamma"))
@@ -74,10 +78,6 @@ def test_search_moves_review_without_bookmarks():
 
 def test_search_strips_ansi_codes():
 	"""Search must find text even when the terminal buffer contains ANSI escape sequences."""
-	_setup_textinfos()
-
-	from globalPlugins.terminalAccess import OutputSearchManager
-
 	# Terminal text with ANSI color codes wrapping the word "error"
 	ansi_text = "line1\n\x1b[31merror\x1b[0m occurred\nline3"
 	manager = OutputSearchManager(DummyTerminal(ansi_text))
@@ -95,10 +95,6 @@ def test_search_strips_ansi_codes():
 
 def test_search_strips_osc_sequences():
 	"""Search must strip OSC sequences (hyperlinks, window titles) before matching."""
-	_setup_textinfos()
-
-	from globalPlugins.terminalAccess import OutputSearchManager
-
 	# OSC hyperlink wrapping a filename
 	osc_text = "see \x1b]8;;http://example.com\x07readme.md\x1b]8;;\x07 for details"
 	manager = OutputSearchManager(DummyTerminal(osc_text))
@@ -114,10 +110,6 @@ def test_search_strips_osc_sequences():
 
 def test_search_case_insensitive():
 	"""Case-insensitive search must match regardless of casing."""
-	_setup_textinfos()
-
-	from globalPlugins.terminalAccess import OutputSearchManager
-
 	manager = OutputSearchManager(DummyTerminal("Hello World\nGOODBYE WORLD"))
 
 	assert manager.search("hello", case_sensitive=False) == 1
@@ -127,10 +119,6 @@ def test_search_case_insensitive():
 
 def test_search_next_and_previous():
 	"""Next and previous match navigation must cycle through results."""
-	_setup_textinfos()
-
-	from globalPlugins.terminalAccess import OutputSearchManager
-
 	api.setReviewPosition.reset_mock()
 
 	manager = OutputSearchManager(DummyTerminal("aaa\nbbb\naaa\nccc\naaa"))
@@ -161,3 +149,92 @@ def test_search_next_and_previous():
 	assert manager.previous_match() is True
 	info = manager.get_current_match_info()
 	assert info[0] == 3  # wrapped to match 3
+
+
+def test_find_line_matches_reports_first_hit_per_line():
+	"""The buffer scan yields one (line, column) per matching line."""
+	text = "ab ab\n\nxab\nnone\nab"
+	assert _find_line_matches(text, "ab") == [(0, 0), (2, 1), (4, 0)]
+	assert _find_line_matches(text, "zz") == []
+	# Per-line semantics: a needle never spans a line break.
+	assert _find_line_matches(text, "ab\n") == []
+
+
+def test_search_match_offsets_use_matching_line():
+	"""Case-insensitive matches record the column on their own line."""
+	manager = OutputSearchManager(DummyTerminal("x\n  Beta\nalpha BETA"))
+
+	assert manager.search("beta") == 2
+	assert [(m[2], m[4]) for m in manager._matches] == [(2, 2), (3, 6)]
+
+
+def test_repeated_search_on_unchanged_buffer_reuses_matches():
+	"""Same query on the same buffer skips the strip and scan but resets navigation."""
+	terminal = DummyTerminal("aaa\nbbb\naaa")
+	manager = OutputSearchManager(terminal)
+
+	with patch.object(_rt, "strip_ansi", side_effect=lambda text: text) as strip:
+		assert manager.search("aaa") == 2
+		assert manager.next_match() is True
+		assert manager.search("aaa") == 2
+		assert strip.call_count == 1
+		assert manager.get_current_match_info() is None
+
+		terminal.text = "aaa\nbbb"
+		assert manager.search("aaa") == 1
+		assert strip.call_count == 2
+
+
+def test_buffer_scope_cache_ignores_caret_line():
+	"""A buffer-scope repeat hits the cache after the caret moves."""
+	manager = OutputSearchManager(DummyTerminal("aaa\nbbb\naaa"))
+
+	with patch.object(_rt, "strip_ansi", side_effect=lambda text: text) as strip:
+		assert manager.search("aaa", current_line=0) == 2
+		assert manager.search("aaa", current_line=2) == 2
+		assert strip.call_count == 1
+
+
+def test_search_cache_keeps_no_buffer_copy_and_clears():
+	"""The cache is keyed on a buffer fingerprint and dropped by clear_search()."""
+	text = "aaa\nbbb\naaa"
+	manager = OutputSearchManager(DummyTerminal(text))
+
+	assert manager.search("aaa") == 2
+	assert manager._search_cache[0][0] == (len(text), hash(text))
+	assert text not in manager._search_cache[0]
+
+	manager.clear_search()
+	assert manager._search_cache is None
+	with patch.object(_rt, "strip_ansi", side_effect=lambda t: t) as strip:
+		assert manager.search("aaa") == 2
+		assert strip.call_count == 1
+
+
+def test_case_insensitive_searches_lower_buffer_once():
+	"""New queries on an unchanged buffer reuse its lowered copy."""
+	terminal = DummyTerminal("Alpha\nBETA\nalpha beta")
+	manager = OutputSearchManager(terminal)
+
+	assert manager.search("alpha") == 2
+	lowered = manager._lowered_text[1]
+	assert manager.search("BETA") == 2
+	assert manager._lowered_text[1] is lowered
+
+	terminal.text = "Gamma"
+	assert manager.search("gamma") == 1
+	assert manager._lowered_text == ((5, hash("Gamma")), "gamma")
+
+	manager.clear_search()
+	assert manager._lowered_text is None
+
+
+def test_repeated_short_match_lines_share_one_string():
+	"""Equal short line texts are interned; long ones are stored as read."""
+	long_line = "ok " + "x" * OutputSearchManager.INTERN_LINE_LENGTH
+	manager = OutputSearchManager(DummyTerminal(f"ok go\nnope\nok go\n{long_line}\n{long_line}"))
+
+	assert manager.search("ok") == 4
+	texts = [m[1] for m in manager._matches]
+	assert texts[0] is texts[1]
+	assert texts[2] == texts[3] and texts[2] is not texts[3]
@@ -6,24 +6,13 @@ These tests ensure that performance-critical operations stay within acceptable l
 
 import unittest
 import time
-from unittest.mock import Mock, MagicMock, patch
-import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 
 class TestPositionCalculationPerformance(unittest.TestCase):
 	"""Test position calculation performance."""
 
-	def setUp(self):
-		"""Set up test fixtures."""
-		# Mock NVDA modules
-		self.mock_textInfos = MagicMock()
-		sys.modules['textInfos'] = self.mock_textInfos
-
-	def tearDown(self):
-		"""Clean up after tests."""
-		if 'textInfos' in sys.modules:
-			del sys.modules['textInfos']
-
 	def test_position_calculation_benchmark(self):
 		"""Test position calculation completes within time limit."""
 		from addon.globalPlugins.terminalAccess import PositionCalculator
@@ -95,17 +84,6 @@ class TestPositionCalculationPerformance(unittest.TestCase):
 class TestLargeSelectionPerformance(unittest.TestCase):
 	"""Test performance with large text selections."""
 
-	def setUp(self):
-		"""Set up test fixtures."""
-		# Mock NVDA modules
-		self.mock_textInfos = MagicMock()
-		sys.modules['textInfos'] = self.mock_textInfos
-
-	def tearDown(self):
-		"""Clean up after tests."""
-		if 'textInfos' in sys.modules:
-			del sys.modules['textInfos']
-
 	def test_large_selection_performance(self):
 		"""Test large selection handling completes in reasonable time."""
 		# Create a large text buffer (1000 lines)
@@ -174,37 +152,29 @@ class TestMemoryUsage(unittest.TestCase):
 
 		cache = PositionCache()
 
-		# Store a position
-		bookmark = "test_bookmark"
-		cache.set(bookmark, 10, 20)
+		with patch('lib.caching.time') as mock_time:
+			mock_time.monotonic_ns.return_value = 1_000_000
 
-		# Verify it's cached
-		result = cache.get(bookmark)
-		self.assertIsNotNone(result)
+			# Store a position
+			bookmark = "test_bookmark"
+			cache.set(bookmark, 10, 20)
 
-		# Wait for expiration (cache timeout is 1000ms)
-		time.sleep(1.1)
+			# Verify it's cached
+			result = cache.get(bookmark)
+			self.assertIsNotNone(result)
 
-		# Verify it expired
-		result = cache.get(bookmark)
-		self.assertIsNone(result,
-			"Cache entry should have expired after timeout")
+			# Step the clock to the deadline (cache timeout is 1s)
+			mock_time.monotonic_ns.return_value = 1_000_000 + cache.CACHE_TIMEOUT_NS
+
+			# Verify it expired
+			result = cache.get(bookmark)
+			self.assertIsNone(result,
+				"Cache entry should have expired after timeout")
 
 
 class TestEventHandlerPerformance(unittest.TestCase):
 	"""Test event handler performance."""
 
-	def setUp(self):
-		"""Set up test fixtures."""
-		# Mock NVDA modules
-		self.mock_api = MagicMock()
-		sys.modules['api'] = self.mock_api
-
-	def tearDown(self):
-		"""Clean up after tests."""
-		if 'api' in sys.modules:
-			del sys.modules['api']
-
 	def test_focus_event_latency(self):
 		"""Test focus event handling has low latency."""
 		# Focus events should be processed quickly
@@ -214,13 +184,14 @@ class TestEventHandlerPerformance(unittest.TestCase):
 
 		# Simulate focus event processing
 		# In real scenario, this would call event_gainFocus
-		mock_obj = MagicMock()
-		mock_obj.appModule = MagicMock()
-		mock_obj.appModule.appName = "WindowsTerminal"
+		obj = SimpleNamespace(appModule=SimpleNamespace(appName="WindowsTerminal"))
+		app_name = obj.appModule.appName.lower()
 
 		end_time = time.perf_counter()
 		elapsed = end_time - start_time
 
+		self.assertEqual(app_name, "windowsterminal")
+
 		# Should complete in under 10ms
 		self.assertLess(elapsed, 0.01,
 			f"Focus event took {elapsed:.3f}s, expected < 0.01s")
@@ -291,5 +262,27 @@ class TestConfigurationPerformance(unittest.TestCase):
 			f"Config save took {elapsed:.3f}s, expected < 0.01s")
 
 
+class TestOutputSearchPerformance(unittest.TestCase):
+	"""Test literal output search over large buffers."""
+
+	def test_whole_buffer_find_1mb(self):
+		"""A literal search over a 1 MB buffer stays under 20ms."""
+		from lib.search import _find_line_matches
+
+		line = "2026-10-16 12:00:00 INFO worker-07 processed batch, status ok\n"
+		buffer = line * (1_048_576 // len(line)) + "ERROR worker-07: connection reset by peer"
+		last_line = buffer.count('\n')
+
+		start_ns = time.perf_counter_ns()
+		hits = _find_line_matches(buffer, "connection reset by peer")
+		misses = _find_line_matches(buffer, "segmentation fault (core dumped)")
+		elapsed_ns = time.perf_counter_ns() - start_ns
+
+		self.assertEqual(hits, [(last_line, 17)])
+		self.assertEqual(misses, [])
+		self.assertLess(elapsed_ns, 20_000_000,
+			f"1 MB search took {elapsed_ns / 1e6:.1f}ms, expected < 20ms")
+
+
 if __name__ == '__main__':
 	unittest.main()
@@ -5,53 +5,43 @@ Tests cover profile list, import/export, delete operations, and UI integration.
 """
 
 import unittest
-from unittest.mock import Mock, MagicMock, patch, mock_open
-import sys
 import json
 
+# The NVDA module mocks are installed by conftest.py before collection,
+# so the add-on can be imported once here instead of in every test.
+from globalPlugins.terminalAccess import (
+	_BUILTIN_PROFILE_NAMES,
+	ApplicationProfile,
+	ProfileManager,
+)
+from lib.settings_panel import TerminalAccessSettingsPanel
 
-class TestProfileManagementUI(unittest.TestCase):
-	"""Test profile management UI in settings panel."""
+# Default profiles every install ships with.
+_CORE_PROFILE_NAMES = frozenset({'vim', 'tmux', 'htop', 'less', 'git'})
 
-	def setUp(self):
-		"""Set up test fixtures.
 
-		Uses the mocks already installed by conftest.py.
-		No local sys.modules manipulation needed.
-		"""
-		pass
+class TestProfileManagementUI(unittest.TestCase):
+	"""Test profile management UI in settings panel."""
 
 	def test_profile_list_exists(self):
 		"""TerminalAccessSettingsPanel class exists and is callable."""
-		from lib.settings_panel import TerminalAccessSettingsPanel
 		self.assertTrue(callable(TerminalAccessSettingsPanel))
 
 	def test_get_profile_names(self):
 		"""ProfileManager.profiles contains default profile names."""
-		from globalPlugins.terminalAccess import ProfileManager
-
 		mgr = ProfileManager()
-		names = sorted(mgr.profiles.keys())
-		# Should contain known defaults
-		for expected in ['vim', 'tmux', 'htop', 'less', 'git']:
-			self.assertIn(expected, names)
+		# Every built-in name has a default profile
+		self.assertLessEqual(_BUILTIN_PROFILE_NAMES, mgr.profiles.keys())
 
 	def test_is_default_profile(self):
 		"""_BUILTIN_PROFILE_NAMES identifies default vs custom profiles."""
-		from globalPlugins.terminalAccess import _BUILTIN_PROFILE_NAMES
-
-		for profile in ['vim', 'tmux', 'htop', 'less', 'git', 'nano', 'irssi']:
-			self.assertIn(profile, _BUILTIN_PROFILE_NAMES,
-				f"{profile} should be a built-in profile")
-
-		for profile in ['myapp', 'custom_tool']:
-			self.assertNotIn(profile, _BUILTIN_PROFILE_NAMES,
-				f"{profile} should NOT be a built-in profile")
+		self.assertIsInstance(_BUILTIN_PROFILE_NAMES, frozenset)
+		self.assertLessEqual(_CORE_PROFILE_NAMES | {'nano', 'irssi'}, _BUILTIN_PROFILE_NAMES)
+		self.assertTrue(_BUILTIN_PROFILE_NAMES.isdisjoint({'myapp', 'custom_tool'}),
+			"custom profile names must not be built-in")
 
 	def test_delete_button_protected_for_defaults(self):
 		"""Default profiles cannot be removed via removeProfile."""
-		from globalPlugins.terminalAccess import ProfileManager
-
 		mgr = ProfileManager()
 		mgr.removeProfile('vim')
 		self.assertIn('vim', mgr.profiles,
@@ -100,47 +90,38 @@ class TestProfileManagementUI(unittest.TestCase):
 class TestProfileManagerIntegration(unittest.TestCase):
 	"""Test ProfileManager integration with UI."""
 
+	@classmethod
+	def setUpClass(cls):
+		"""Build the read-only fixtures once.
+
+		``mgr`` serves tests that only inspect or export; tests that add
+		or remove profiles build their own ProfileManager.
+		"""
+		cls.mgr = ProfileManager()
+		cls.test_data = ApplicationProfile('testapp', 'Test Application').toDict()
+
 	def test_profile_manager_has_export_method(self):
 		"""Test ProfileManager has exportProfile method."""
-		from globalPlugins.terminalAccess import ProfileManager
-
-		mgr = ProfileManager()
-		self.assertTrue(hasattr(mgr, 'exportProfile'))
-		self.assertTrue(callable(mgr.exportProfile))
+		self.assertTrue(hasattr(self.mgr, 'exportProfile'))
+		self.assertTrue(callable(self.mgr.exportProfile))
 
 	def test_profile_manager_has_import_method(self):
 		"""Test ProfileManager has importProfile method."""
-		from globalPlugins.terminalAccess import ProfileManager
-
-		mgr = ProfileManager()
-		self.assertTrue(hasattr(mgr, 'importProfile'))
-		self.assertTrue(callable(mgr.importProfile))
+		self.assertTrue(hasattr(self.mgr, 'importProfile'))
+		self.assertTrue(callable(self.mgr.importProfile))
 
 	def test_profile_manager_has_remove_method(self):
 		"""Test ProfileManager has removeProfile method."""
-		from globalPlugins.terminalAccess import ProfileManager
-
-		mgr = ProfileManager()
-		self.assertTrue(hasattr(mgr, 'removeProfile'))
-		self.assertTrue(callable(mgr.removeProfile))
+		self.assertTrue(hasattr(self.mgr, 'removeProfile'))
+		self.assertTrue(callable(self.mgr.removeProfile))
 
 	def test_profile_manager_default_profiles(self):
 		"""Test ProfileManager initializes with default profiles."""
-		from globalPlugins.terminalAccess import ProfileManager
-
-		mgr = ProfileManager()
-		self.assertIn('vim', mgr.profiles)
-		self.assertIn('tmux', mgr.profiles)
-		self.assertIn('htop', mgr.profiles)
-		self.assertIn('less', mgr.profiles)
-		self.assertIn('git', mgr.profiles)
+		self.assertLessEqual(_CORE_PROFILE_NAMES, self.mgr.profiles.keys())
 
 	def test_profile_export_returns_dict(self):
 		"""Test exportProfile returns dictionary."""
-		from globalPlugins.terminalAccess import ProfileManager
-
-		mgr = ProfileManager()
-		vim_profile = mgr.exportProfile('vim')
+		vim_profile = self.mgr.exportProfile('vim')
 
 		self.assertIsNotNone(vim_profile)
 		self.assertIsInstance(vim_profile, dict)
@@ -148,16 +129,9 @@ class TestProfileManagerIntegration(unittest.TestCase):
 
 	def test_profile_import_creates_profile(self):
 		"""Test importProfile creates new profile from dict."""
-		from globalPlugins.terminalAccess import ProfileManager, ApplicationProfile
-
 		mgr = ProfileManager()
 
-		# Create a test profile
-		test_profile = ApplicationProfile('testapp', 'Test Application')
-		test_data = test_profile.toDict()
-
-		# Import it
-		imported = mgr.importProfile(test_data)
+		imported = mgr.importProfile(self.test_data)
 
 		self.assertIsNotNone(imported)
 		self.assertEqual(imported.appName, 'testapp')
@@ -165,8 +139,6 @@ class TestProfileManagerIntegration(unittest.TestCase):
 
 	def test_profile_remove_deletes_custom_profile(self):
 		"""Test removeProfile deletes custom profiles."""
-		from globalPlugins.terminalAccess import ProfileManager, ApplicationProfile
-
 		mgr = ProfileManager()
 
 		# Add a custom profile
@@ -180,8 +152,6 @@ class TestProfileManagerIntegration(unittest.TestCase):
 
 	def test_profile_remove_protects_default_profiles(self):
 		"""Test removeProfile does not delete default profiles."""
-		from globalPlugins.terminalAccess import ProfileManager
-
 		mgr = ProfileManager()
 
 		# Try to remove a default profile
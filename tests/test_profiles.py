@@ -5,10 +5,16 @@ Tests cover profile detection, activation, window definitions, and persistence.
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 import sys
 
 
+def _focus_obj(app_name):
+	"""Return a plain focus object exposing only appModule.appName."""
+	return SimpleNamespace(appModule=SimpleNamespace(appName=app_name))
+
+
 class TestProfileDetection(unittest.TestCase):
 	"""Test automatic profile detection via isTerminalApp."""
 
@@ -17,36 +23,32 @@ class TestProfileDetection(unittest.TestCase):
 		from globalPlugins.terminalAccess import GlobalPlugin
 
 		plugin = GlobalPlugin()
-		mock_obj = MagicMock()
-		mock_obj.appModule.appName = 'windowsterminal'
-		self.assertTrue(plugin.isTerminalApp(mock_obj))
+		obj = _focus_obj('windowsterminal')
+		self.assertTrue(plugin.isTerminalApp(obj))
 
 	def test_powershell_detection(self):
 		"""PowerShell is recognized as a terminal application."""
 		from globalPlugins.terminalAccess import GlobalPlugin
 
 		plugin = GlobalPlugin()
-		mock_obj = MagicMock()
-		mock_obj.appModule.appName = 'powershell'
-		self.assertTrue(plugin.isTerminalApp(mock_obj))
+		obj = _focus_obj('powershell')
+		self.assertTrue(plugin.isTerminalApp(obj))
 
 	def test_cmd_detection(self):
 		"""cmd.exe is recognized as a terminal application."""
 		from globalPlugins.terminalAccess import GlobalPlugin
 
 		plugin = GlobalPlugin()
-		mock_obj = MagicMock()
-		mock_obj.appModule.appName = 'cmd'
-		self.assertTrue(plugin.isTerminalApp(mock_obj))
+		obj = _focus_obj('cmd')
+		self.assertTrue(plugin.isTerminalApp(obj))
 
 	def test_non_terminal_rejected(self):
 		"""Non-terminal apps like notepad are not recognized."""
 		from globalPlugins.terminalAccess import GlobalPlugin
 
 		plugin = GlobalPlugin()
-		mock_obj = MagicMock()
-		mock_obj.appModule.appName = 'notepad'
-		self.assertFalse(plugin.isTerminalApp(mock_obj))
+		obj = _focus_obj('notepad')
+		self.assertFalse(plugin.isTerminalApp(obj))
 
 	def test_supported_terminals_constant(self):
 		"""_SUPPORTED_TERMINALS contains expected terminal app names."""
@@ -147,9 +149,8 @@ class TestWindowDefinitions(unittest.TestCase):
 
 		plugin = GlobalPlugin()
 		for app_name in list(_SUPPORTED_TERMINALS)[:5]:
-			mock_obj = MagicMock()
-			mock_obj.appModule.appName = app_name
-			self.assertTrue(plugin.isTerminalApp(mock_obj),
+			obj = _focus_obj(app_name)
+			self.assertTrue(plugin.isTerminalApp(obj),
 				f"{app_name} should be recognized as terminal")
 
 
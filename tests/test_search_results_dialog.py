@@ -13,9 +13,13 @@ from unittest.mock import Mock, MagicMock, patch, call
 import api
 import textInfos
 import tones
+import ui
 
 import pytest
 
+from globalPlugins.terminalAccess import GlobalPlugin
+from lib.search import OutputSearchManager
+
 
 # ---------------------------------------------------------------------------
 # Helpers (reused from test_output_search.py)
@@ -55,8 +59,9 @@ class DummyTerminal:
 		raise ValueError("Bookmarks not supported")
 
 
-def _setup_textinfos():
-	"""Ensure textInfos constants are set."""
+@pytest.fixture(scope="module", autouse=True)
+def _textinfos_constants():
+	"""Give the textInfos mock plain position/unit constants once per module."""
 	textInfos.POSITION_ALL = "all"
 	textInfos.POSITION_FIRST = "first"
 	textInfos.UNIT_LINE = "line"
@@ -72,9 +77,6 @@ class TestGetAllMatches:
 
 	def test_returns_empty_list_when_no_matches(self):
 		"""get_all_matches() returns [] when the last search found nothing."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("alpha\nbeta\ngamma"))
 		manager.search("zzz_does_not_exist")
 		result = manager.get_all_matches()
@@ -82,18 +84,12 @@ class TestGetAllMatches:
 
 	def test_returns_empty_list_when_no_search_performed(self):
 		"""get_all_matches() returns [] before any search is run."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("alpha\nbeta"))
 		result = manager.get_all_matches()
 		assert result == []
 
 	def test_returns_structured_dicts_after_search(self):
 		"""get_all_matches() returns list of dicts with num, line_num, text keys."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("aaa\nbbb\naaa"))
 		count = manager.search("aaa")
 		assert count == 2
@@ -122,9 +118,6 @@ class TestGetAllMatches:
 
 	def test_match_text_truncated_to_100_chars(self):
 		"""Lines longer than 100 characters are truncated with ellipsis."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		long_line = "x" * 150
 		manager = OutputSearchManager(DummyTerminal(long_line))
 		count = manager.search("x")
@@ -137,9 +130,6 @@ class TestGetAllMatches:
 
 	def test_match_numbers_are_1_based(self):
 		"""First match has num=1, not num=0."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("err\nok\nerr\nok\nerr"))
 		manager.search("err")
 
@@ -149,9 +139,6 @@ class TestGetAllMatches:
 
 	def test_match_line_numbers_are_1_based(self):
 		"""Line numbers in results are 1-based (matching existing search convention)."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("ok\nerr\nok"))
 		manager.search("err")
 
@@ -173,7 +160,6 @@ class TestSearchFlowBeeps:
 
 	def _make_plugin(self):
 		"""Create a minimally mocked GlobalPlugin instance."""
-		from globalPlugins.terminalAccess import GlobalPlugin
 		plugin = GlobalPlugin.__new__(GlobalPlugin)
 		plugin._initState()
 		plugin._initManagers()
@@ -182,7 +168,6 @@ class TestSearchFlowBeeps:
 
 	def test_no_matches_beeps_low(self):
 		"""_handleSearchResult(text, 0) calls tones.beep(300, 100)."""
-		_setup_textinfos()
 		plugin = self._make_plugin()
 		tones.beep.reset_mock()
 
@@ -193,7 +178,6 @@ class TestSearchFlowBeeps:
 
 	def test_matches_found_beeps_high(self):
 		"""_handleSearchResult(text, N>0) calls tones.beep(800, 50)."""
-		_setup_textinfos()
 		plugin = self._make_plugin()
 		tones.beep.reset_mock()
 
@@ -204,8 +188,6 @@ class TestSearchFlowBeeps:
 
 	def test_no_matches_announces_pattern(self):
 		"""_handleSearchResult announces 'No matches found for ...' on zero results."""
-		_setup_textinfos()
-		import ui
 		plugin = self._make_plugin()
 		ui.message.reset_mock()
 
@@ -223,9 +205,6 @@ class TestSearchResultsDialogData:
 
 	def test_dialog_receives_match_list(self):
 		"""get_all_matches returns data suitable for dialog population."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		manager = OutputSearchManager(DummyTerminal("ERROR: fail\nOK\nERROR: timeout"))
 		manager.search("ERROR")
 
@@ -242,9 +221,6 @@ class TestSearchResultsDialogData:
 
 	def test_jump_sets_review_position(self):
 		"""When a match is selected and jumped to, setReviewPosition is called."""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		api.setReviewPosition.reset_mock()
 
 		manager = OutputSearchManager(DummyTerminal("aaa\nbbb\naaa"))
@@ -265,9 +241,6 @@ class TestSearchResultsDialogData:
 
 	def test_jump_sets_searchJumpPending(self):
 		"""Jumping from dialog should set _searchJumpPending = True on the plugin."""
-		_setup_textinfos()
-		from globalPlugins.terminalAccess import GlobalPlugin
-
 		plugin = GlobalPlugin.__new__(GlobalPlugin)
 		plugin._initState()
 		plugin._initManagers()
@@ -298,9 +271,6 @@ class TestSearchFlowNoAutoJump:
 		We verify this by checking that after search(), the current_match_index
 		remains at -1 (untouched).
 		"""
-		_setup_textinfos()
-		from lib.search import OutputSearchManager
-
 		api.setReviewPosition.reset_mock()
 
 		manager = OutputSearchManager(DummyTerminal("aaa\nbbb\naaa"))
@@ -316,10 +286,6 @@ class TestSearchFlowNoAutoJump:
 
 	def test_search_does_not_set_searchJumpPending_directly(self):
 		"""_searchJumpPending stays False after search — only dialog jump sets it."""
-		_setup_textinfos()
-		from globalPlugins.terminalAccess import GlobalPlugin
-		from lib.search import OutputSearchManager
-
 		plugin = GlobalPlugin.__new__(GlobalPlugin)
 		plugin._initState()
 		plugin._initManagers()
@@ -4,17 +4,42 @@ Unit tests for selection and copy operations.
 Tests selection functionality and resource limit validation.
 """
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import sys
+from types import SimpleNamespace
+
+from globalPlugins.terminalAccess import (
+    PUNCT_ALL,
+    PUNCT_MOST,
+    PUNCT_NONE,
+    PUNCT_SOME,
+    PUNCTUATION_SETS,
+    GlobalPlugin,
+    _NON_TERMINAL_APPS,
+    _SUPPORTED_TERMINALS,
+    _validateSelectionSize,
+)
+
+
+# (appName, expected isTerminalApp result)
+_TERMINAL_APP_CASES = (
+    ("windowsterminal", True),
+    ("cmd", True),
+    ("powershell", True),
+    ("pwsh", True),
+    ("conhost", True),
+    ("notepad", False),
+    ("WindowsTerminal", True),  # mixed case
+)
+
+
+def _make_obj(app_name):
+    """Return a focus object stand-in exposing only appModule.appName."""
+    return SimpleNamespace(appModule=SimpleNamespace(appName=app_name))
 
 
 class TestSelectionOperations(unittest.TestCase):
     """Test selection operation functions."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import _validateSelectionSize
-        self._validateSelectionSize = _validateSelectionSize
+    _validateSelectionSize = staticmethod(_validateSelectionSize)
 
     def test_validate_selection_within_limits(self):
         """Test selection validation for normal-sized selections."""
@@ -58,139 +83,67 @@ class TestSelectionOperations(unittest.TestCase):
 class TestPunctuationProcessing(unittest.TestCase):
     """Test punctuation level system."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from globalPlugins.terminalAccess import PUNCTUATION_SETS, PUNCT_NONE, PUNCT_SOME, PUNCT_MOST, PUNCT_ALL
-        self.PUNCTUATION_SETS = PUNCTUATION_SETS
-        self.PUNCT_NONE = PUNCT_NONE
-        self.PUNCT_SOME = PUNCT_SOME
-        self.PUNCT_MOST = PUNCT_MOST
-        self.PUNCT_ALL = PUNCT_ALL
+    # (level, symbols the level must include; empty = no symbols at all,
+    # None = every symbol is processed)
+    _EXPECTATIONS = (
+        (PUNCT_NONE, frozenset()),
+        (PUNCT_SOME, frozenset('.,?!')),
+        (PUNCT_MOST, frozenset('.,@#$()')),
+        (PUNCT_ALL, None),
+    )
 
     def test_punctuation_sets_structure(self):
         """Test punctuation sets are properly structured."""
-        self.assertIsInstance(self.PUNCTUATION_SETS, dict)
-        self.assertEqual(len(self.PUNCTUATION_SETS), 4)
-
-    def test_punctuation_none_empty(self):
-        """Test PUNCT_NONE has empty set."""
-        punct_set = self.PUNCTUATION_SETS[self.PUNCT_NONE]
-        self.assertIsInstance(punct_set, set)
-        self.assertEqual(len(punct_set), 0)
-
-    def test_punctuation_some_basic(self):
-        """Test PUNCT_SOME has basic punctuation."""
-        punct_set = self.PUNCTUATION_SETS[self.PUNCT_SOME]
-        self.assertIsInstance(punct_set, set)
-        self.assertIn('.', punct_set)
-        self.assertIn(',', punct_set)
-        self.assertIn('?', punct_set)
-        self.assertIn('!', punct_set)
-
-    def test_punctuation_most_extended(self):
-        """Test PUNCT_MOST has extended punctuation."""
-        punct_set = self.PUNCTUATION_SETS[self.PUNCT_MOST]
-        self.assertIsInstance(punct_set, set)
-
-        # Should include PUNCT_SOME
-        self.assertIn('.', punct_set)
-        self.assertIn(',', punct_set)
-
-        # Plus additional symbols
-        self.assertIn('@', punct_set)
-        self.assertIn('#', punct_set)
-        self.assertIn('$', punct_set)
-        self.assertIn('(', punct_set)
-        self.assertIn(')', punct_set)
-
-    def test_punctuation_all_none(self):
-        """Test PUNCT_ALL is None (process everything)."""
-        punct_set = self.PUNCTUATION_SETS[self.PUNCT_ALL]
-        self.assertIsNone(punct_set)
+        self.assertIsInstance(PUNCTUATION_SETS, dict)
+        self.assertEqual(len(PUNCTUATION_SETS), 4)
+
+    def test_punctuation_levels(self):
+        """Each level holds at least its expected symbols; PUNCT_ALL is None."""
+        for level, expected in self._EXPECTATIONS:
+            with self.subTest(level=level):
+                punct_set = PUNCTUATION_SETS[level]
+                if expected is None:
+                    self.assertIsNone(punct_set)
+                    continue
+                self.assertIsInstance(punct_set, frozenset)
+                if expected:
+                    self.assertLessEqual(expected, punct_set)
+                else:
+                    self.assertEqual(punct_set, expected)
 
 
 class TestTerminalDetection(unittest.TestCase):
     """Test terminal application detection."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Ensure gui module is available (conftest should have mocked it)
-        import gui
-        from globalPlugins.terminalAccess import GlobalPlugin
-        with patch('gui.settingsDialogs.NVDASettingsDialog'):
-            self.plugin = GlobalPlugin()
+    @classmethod
+    def setUpClass(cls):
+        """Build one plugin for the class; isTerminalApp never mutates it.
 
-    def test_is_terminal_app_windows_terminal(self):
-        """Test detection of Windows Terminal."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "windowsterminal"
+        The settings dialog is already patched by conftest for the session.
+        """
+        cls.plugin = GlobalPlugin()
 
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
-
-    def test_is_terminal_app_cmd(self):
-        """Test detection of Command Prompt."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "cmd"
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
-
-    def test_is_terminal_app_powershell(self):
-        """Test detection of PowerShell."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "powershell"
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
-
-    def test_is_terminal_app_pwsh(self):
-        """Test detection of PowerShell Core."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "pwsh"
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
+    def test_is_terminal_app(self):
+        """Known terminals are detected case-insensitively; other apps are not."""
+        for app_name, expected in _TERMINAL_APP_CASES:
+            with self.subTest(app_name=app_name):
+                self.assertIs(self.plugin.isTerminalApp(_make_obj(app_name)), expected)
 
-    def test_is_terminal_app_conhost(self):
-        """Test detection of Console Host."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "conhost"
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
-
-    def test_is_terminal_app_non_terminal(self):
-        """Test non-terminal application is not detected."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "notepad"
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertFalse(result)
+    def test_terminal_app_names_are_frozensets(self):
+        """isTerminalApp relies on O(1) lookups into immutable lowercase name sets."""
+        for names in (_SUPPORTED_TERMINALS, _NON_TERMINAL_APPS):
+            self.assertIsInstance(names, frozenset)
+            self.assertTrue(all(name == name.lower() for name in names))
+        for app_name, expected in _TERMINAL_APP_CASES:
+            self.assertEqual(app_name.lower() in _SUPPORTED_TERMINALS, expected)
 
     def test_is_terminal_app_no_appmodule(self):
         """Test object without appModule is not detected."""
-        obj = Mock()
-        obj.appModule = None
+        obj = SimpleNamespace(appModule=None)
 
         result = self.plugin.isTerminalApp(obj)
         self.assertFalse(result)
 
-    def test_is_terminal_app_case_insensitive(self):
-        """Test terminal detection is case-insensitive."""
-        obj = Mock()
-        obj.appModule = Mock()
-        obj.appModule.appName = "WindowsTerminal"  # Mixed case
-
-        result = self.plugin.isTerminalApp(obj)
-        self.assertTrue(result)
-
 
 if __name__ == '__main__':
     unittest.main()
@@ -42,12 +42,12 @@ class TestCacheStress(unittest.TestCase):
 		self.assertEqual(len(errors), 0, f"Cache errors: {errors}")
 
 	def test_cache_expiry_under_load(self):
-		"""Cache entries expire after CACHE_TIMEOUT_S."""
+		"""Cache entries expire after CACHE_TIMEOUT_NS."""
 		from globalPlugins.terminalAccess import PositionCache
 
 		cache = PositionCache()
-		original_timeout = PositionCache.CACHE_TIMEOUT_S
-		PositionCache.CACHE_TIMEOUT_S = 0.05
+		original_timeout = PositionCache.CACHE_TIMEOUT_NS
+		PositionCache.CACHE_TIMEOUT_NS = 50_000_000
 
 		try:
 			for i in range(50):
@@ -56,7 +56,7 @@ class TestCacheStress(unittest.TestCase):
 			expired_count = sum(1 for i in range(50) if cache.get(f"key_{i}") is None)
 			self.assertEqual(expired_count, 50, "All entries should have expired")
 		finally:
-			PositionCache.CACHE_TIMEOUT_S = original_timeout
+			PositionCache.CACHE_TIMEOUT_NS = original_timeout
 
 	def test_lru_eviction(self):
 		"""Cache evicts oldest entries when exceeding MAX_CACHE_SIZE."""
@@ -100,11 +100,11 @@ class TestTextDifferStress(unittest.TestCase):
 
 		text2 = text1 + "\nnew line appended"
 
-		start = time.time()
+		start = time.perf_counter_ns()
 		kind, content = differ.update(text2)
-		elapsed = time.time() - start
+		elapsed_ns = time.perf_counter_ns() - start
 
-		self.assertLess(elapsed, 5.0, f"Diff took {elapsed:.2f}s")
+		self.assertLess(elapsed_ns, 5_000_000_000, f"Diff took {elapsed_ns / 1e9:.2f}s")
 
 
 @pytest.mark.stress
@@ -118,11 +118,11 @@ class TestANSIStress(unittest.TestCase):
 
 		malformed = "\x1b[" * 5000 + "m" * 5000
 
-		start = time.time()
+		start = time.perf_counter_ns()
 		result = ANSIParser.stripANSI(malformed)
-		elapsed = time.time() - start
+		elapsed_ns = time.perf_counter_ns() - start
 
-		self.assertLess(elapsed, 5.0, f"Adversarial ANSI took {elapsed:.2f}s")
+		self.assertLess(elapsed_ns, 5_000_000_000, f"Adversarial ANSI took {elapsed_ns / 1e9:.2f}s")
 		self.assertIsInstance(result, str)
 
 	def test_large_clean_strip(self):
@@ -131,11 +131,11 @@ class TestANSIStress(unittest.TestCase):
 
 		text = "Hello world! " * 8000
 
-		start = time.time()
+		start = time.perf_counter_ns()
 		result = ANSIParser.stripANSI(text)
-		elapsed = time.time() - start
+		elapsed_ns = time.perf_counter_ns() - start
 
-		self.assertLess(elapsed, 2.0, f"Large strip took {elapsed:.2f}s")
+		self.assertLess(elapsed_ns, 2_000_000_000, f"Large strip took {elapsed_ns / 1e9:.2f}s")
 		self.assertEqual(result, text)
 
 	def test_rgb_color_heavy(self):
@@ -145,11 +145,11 @@ class TestANSIStress(unittest.TestCase):
 		colored = "".join(f"\x1b[38;2;{i%256};{(i*7)%256};{(i*13)%256}mX" for i in range(10000))
 		colored += "\x1b[0m"
 
-		start = time.time()
+		start = time.perf_counter_ns()
 		result = ANSIParser.stripANSI(colored)
-		elapsed = time.time() - start
+		elapsed_ns = time.perf_counter_ns() - start
 
-		self.assertLess(elapsed, 5.0)
+		self.assertLess(elapsed_ns, 5_000_000_000)
 		self.assertEqual(len(result), 10000)
 
 
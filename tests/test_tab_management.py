@@ -1,19 +1,35 @@
 """
 Tests for tab management functionality in Terminal Access.
 """
-import sys
-from unittest.mock import Mock, MagicMock, patch
-import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from globalPlugins.terminalAccess import (
+	BookmarkManager,
+	CommandHistoryManager,
+	OutputSearchManager,
+	TabManager,
+)
+
+
+def _make_terminal(window_text="Terminal", window_handle=12345):
+	"""Return a terminal stand-in exposing only what TabManager reads."""
+	return SimpleNamespace(windowHandle=window_handle, windowText=window_text)
+
+
+def _review_position(bookmark):
+	"""Return a review TextInfo stand-in on the first line.
+
+	``_lineNumber`` lets BookmarkManager resolve the line directly rather
+	than walking ``move()`` back to the top of the buffer.
+	"""
+	return SimpleNamespace(bookmark=bookmark, text="", _lineNumber=0)
 
 
 def test_tab_manager_initialization():
 	"""Test that TabManager initializes correctly."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "Terminal - Tab 1"
+	terminal = _make_terminal("Terminal - Tab 1")
 
 	# Create TabManager
 	manager = TabManager(terminal)
@@ -27,16 +43,9 @@ def test_tab_manager_initialization():
 
 def test_tab_manager_generates_unique_ids():
 	"""Test that TabManager generates unique IDs for different terminals."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create two different mock terminals
-	terminal1 = Mock()
-	terminal1.windowHandle = 12345
-	terminal1.windowText = "Terminal - Tab 1"
-
-	terminal2 = Mock()
-	terminal2.windowHandle = 67890
-	terminal2.windowText = "Terminal - Tab 2"
+	terminal1 = _make_terminal("Terminal - Tab 1")
+	terminal2 = _make_terminal("Terminal - Tab 2", 67890)
 
 	# Create TabManagers
 	manager1 = TabManager(terminal1)
@@ -51,16 +60,9 @@ def test_tab_manager_generates_unique_ids():
 
 def test_tab_manager_tracks_multiple_tabs():
 	"""Test that TabManager can track multiple tabs."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminals for different tabs
-	terminal1 = Mock()
-	terminal1.windowHandle = 12345
-	terminal1.windowText = "Terminal - Tab 1"
-
-	terminal2 = Mock()
-	terminal2.windowHandle = 12345
-	terminal2.windowText = "Terminal - Tab 2"
+	terminal1 = _make_terminal("Terminal - Tab 1")
+	terminal2 = _make_terminal("Terminal - Tab 2")
 
 	# Create TabManager with first terminal
 	manager = TabManager(terminal1)
@@ -78,16 +80,9 @@ def test_tab_manager_tracks_multiple_tabs():
 
 def test_tab_manager_detects_tab_changes():
 	"""Test that TabManager detects when tabs change."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminals
-	terminal1 = Mock()
-	terminal1.windowHandle = 12345
-	terminal1.windowText = "Terminal - Tab 1"
-
-	terminal2 = Mock()
-	terminal2.windowHandle = 12345
-	terminal2.windowText = "Terminal - Tab 2"
+	terminal1 = _make_terminal("Terminal - Tab 1")
+	terminal2 = _make_terminal("Terminal - Tab 2")
 
 	# Create TabManager
 	manager = TabManager(terminal1)
@@ -99,20 +94,15 @@ def test_tab_manager_detects_tab_changes():
 
 def test_bookmark_manager_tab_aware():
 	"""Test that BookmarkManager is tab-aware."""
-	from globalPlugins.terminalAccess import BookmarkManager, TabManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "Terminal"
+	terminal = _make_terminal("Terminal")
 
 	# Create TabManager and BookmarkManager
 	tab_manager = TabManager(terminal)
 	bookmark_manager = BookmarkManager(terminal, tab_manager)
 
 	# Create mock TextInfo for bookmark
-	mock_textinfo = Mock()
-	mock_textinfo.bookmark = "test_bookmark_obj"
+	mock_textinfo = _review_position("test_bookmark_obj")
 
 	# Set a bookmark
 	with patch('api.getReviewPosition', return_value=mock_textinfo):
@@ -123,18 +113,9 @@ def test_bookmark_manager_tab_aware():
 
 def test_bookmark_manager_per_tab_isolation():
 	"""Test that bookmarks are isolated per tab."""
-	from globalPlugins.terminalAccess import BookmarkManager, TabManager
-
 	# Create mock terminals for different tabs
-	terminal1 = Mock()
-	terminal1.windowHandle = 12345
-	terminal1.windowText = "Tab 1"
-	terminal1.makeTextInfo = Mock(return_value=Mock())
-
-	terminal2 = Mock()
-	terminal2.windowHandle = 12345
-	terminal2.windowText = "Tab 2"
-	terminal2.makeTextInfo = Mock(return_value=Mock())
+	terminal1 = _make_terminal("Tab 1")
+	terminal2 = _make_terminal("Tab 2")
 
 	# Create TabManager
 	tab_manager = TabManager(terminal1)
@@ -143,8 +124,7 @@ def test_bookmark_manager_per_tab_isolation():
 	bookmark_manager = BookmarkManager(terminal1, tab_manager)
 
 	# Set bookmark in tab 1
-	mock_textinfo1 = Mock()
-	mock_textinfo1.bookmark = "bookmark_tab1"
+	mock_textinfo1 = _review_position("bookmark_tab1")
 	with patch('api.getReviewPosition', return_value=mock_textinfo1):
 		bookmark_manager.set_bookmark("1")
 
@@ -156,8 +136,7 @@ def test_bookmark_manager_per_tab_isolation():
 	assert not bookmark_manager.has_bookmark("1")
 
 	# Set different bookmark in tab 2
-	mock_textinfo2 = Mock()
-	mock_textinfo2.bookmark = "bookmark_tab2"
+	mock_textinfo2 = _review_position("bookmark_tab2")
 	with patch('api.getReviewPosition', return_value=mock_textinfo2):
 		bookmark_manager.set_bookmark("2")
 
@@ -176,18 +155,14 @@ def test_bookmark_manager_per_tab_isolation():
 
 def test_bookmark_manager_legacy_mode():
 	"""Test that BookmarkManager works without TabManager (legacy mode)."""
-	from globalPlugins.terminalAccess import BookmarkManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.makeTextInfo = Mock(return_value=Mock())
+	terminal = _make_terminal()
 
 	# Create BookmarkManager without TabManager
 	bookmark_manager = BookmarkManager(terminal, tab_manager=None)
 
 	# Create mock TextInfo
-	mock_textinfo = Mock()
-	mock_textinfo.bookmark = "test_bookmark"
+	mock_textinfo = _review_position("test_bookmark")
 
 	# Set bookmark
 	with patch('api.getReviewPosition', return_value=mock_textinfo):
@@ -205,12 +180,8 @@ def test_bookmark_manager_legacy_mode():
 
 def test_tab_manager_get_tab_title():
 	"""Test that TabManager can retrieve tab titles."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminal with title
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "PowerShell - Administrator"
+	terminal = _make_terminal("PowerShell - Administrator")
 
 	# Create TabManager
 	manager = TabManager(terminal)
@@ -222,12 +193,8 @@ def test_tab_manager_get_tab_title():
 
 def test_tab_manager_clear_tabs():
 	"""Test that TabManager can clear tab information."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "Terminal"
+	terminal = _make_terminal("Terminal")
 
 	# Create TabManager
 	manager = TabManager(terminal)
@@ -240,12 +207,8 @@ def test_tab_manager_clear_tabs():
 
 def test_output_search_manager_with_tab_manager():
 	"""Test that OutputSearchManager can work with TabManager."""
-	from globalPlugins.terminalAccess import OutputSearchManager, TabManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "Terminal"
+	terminal = _make_terminal("Terminal")
 
 	# Create TabManager
 	tab_manager = TabManager(terminal)
@@ -259,12 +222,8 @@ def test_output_search_manager_with_tab_manager():
 
 def test_command_history_manager_with_tab_manager():
 	"""Test that CommandHistoryManager can work with TabManager."""
-	from globalPlugins.terminalAccess import CommandHistoryManager, TabManager
-
 	# Create mock terminal
-	terminal = Mock()
-	terminal.windowHandle = 12345
-	terminal.windowText = "Terminal"
+	terminal = _make_terminal("Terminal")
 
 	# Create TabManager
 	tab_manager = TabManager(terminal)
@@ -278,8 +237,6 @@ def test_command_history_manager_with_tab_manager():
 
 def test_tab_manager_handles_missing_properties():
 	"""Test that TabManager handles terminals with missing properties."""
-	from globalPlugins.terminalAccess import TabManager
-
 	# Create mock terminal without some properties
 	terminal = Mock(spec=[])  # No attributes
 
@@ -9,13 +9,23 @@ Tests for the terminal support expansion:
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
+from globalPlugins.terminalAccess import (
+	ANSIParser,
+	CT_STANDARD,
+	CT_WINDOW,
+	ProfileManager,
+	PUNCT_MOST,
+	TextDiffer,
+	_BUILTIN_PROFILE_NAMES,
+	_SUPPORTED_TERMINALS,
+)
+
 
 class TestComprehensiveANSIStripping(unittest.TestCase):
 	"""Tests for the expanded _STRIP_PATTERN regex in ANSIParser."""
 
 	def _strip(self, text):
 		"""Helper to call ANSIParser.stripANSI."""
-		from globalPlugins.terminalAccess import ANSIParser
 		return ANSIParser.stripANSI(text)
 
 	def test_strip_basic_csi(self):
@@ -73,12 +83,10 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 	"""Tests for the KIND_LAST_LINE_UPDATED detection in TextDiffer."""
 
 	def _make_differ(self):
-		from globalPlugins.terminalAccess import TextDiffer
 		return TextDiffer()
 
 	def test_last_line_overwrite_detected(self):
 		"""When only the last line changes, KIND_LAST_LINE_UPDATED should be returned."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		# Initial state
@@ -90,7 +98,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_last_line_returns_new_tail(self):
 		"""KIND_LAST_LINE_UPDATED should return the new last line content."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("header\nstatus: loading...")
@@ -100,7 +107,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_full_change_not_last_line(self):
 		"""When prefix lines also differ, KIND_CHANGED should be returned."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("line1\nline2\nline3")
@@ -109,7 +115,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_single_line_change_is_changed(self):
 		"""A single line (no newline) change should be KIND_CHANGED, not last-line-updated."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("hello")
@@ -118,7 +123,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_append_still_works(self):
 		"""Appending text should still return KIND_APPENDED."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("line1\n")
@@ -128,7 +132,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_unchanged_still_works(self):
 		"""Identical text should return KIND_UNCHANGED."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("same\ntext")
@@ -137,7 +140,6 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 
 	def test_spinner_overwrite(self):
 		"""Simulated spinner (single char change on last line) should be detected."""
-		from globalPlugins.terminalAccess import TextDiffer
 		differ = self._make_differ()
 
 		differ.update("Building...\n|")
@@ -147,14 +149,30 @@ class TestTextDifferLastLineUpdated(unittest.TestCase):
 		kind, _ = differ.update("Building...\n-")
 		self.assertEqual(kind, TextDiffer.KIND_LAST_LINE_UPDATED)
 
+	def test_same_newline_offset_with_edited_prefix_is_changed(self):
+		"""A last newline at the same offset is not enough; the prefix must match too."""
+		differ = self._make_differ()
+
+		differ.update("line1\nline2\n50%")
+		kind, _ = differ.update("line9\nline2\n75%")
+		self.assertEqual(kind, TextDiffer.KIND_CHANGED)
+
+	def test_cleared_last_line_returns_empty_tail(self):
+		"""Clearing the last line is an overwrite whose new tail is empty."""
+		differ = self._make_differ()
+
+		differ.update("output\nprompt")
+		self.assertEqual(
+			differ.update("output\n"),
+			(TextDiffer.KIND_LAST_LINE_UPDATED, ""),
+		)
+
 
 class TestSupportedTerminals(unittest.TestCase):
 	"""Tests for the expanded _SUPPORTED_TERMINALS frozenset."""
 
 	def test_new_gpu_terminals_present(self):
 		"""New GPU-accelerated terminals should be in _SUPPORTED_TERMINALS."""
-		from globalPlugins.terminalAccess import _SUPPORTED_TERMINALS
-
 		new_terminals = [
 			'ghostty', 'rio', 'waveterm', 'contour', 'cool-retro-term',
 		]
@@ -164,8 +182,6 @@ class TestSupportedTerminals(unittest.TestCase):
 
 	def test_new_professional_terminals_present(self):
 		"""New remote/professional terminals should be in _SUPPORTED_TERMINALS."""
-		from globalPlugins.terminalAccess import _SUPPORTED_TERMINALS
-
 		new_terminals = [
 			'mobaxterm', 'securecrt', 'ttermpro', 'mremoteng', 'royalts',
 		]
@@ -175,8 +191,6 @@ class TestSupportedTerminals(unittest.TestCase):
 
 	def test_existing_terminals_still_present(self):
 		"""Existing terminals should not have been removed."""
-		from globalPlugins.terminalAccess import _SUPPORTED_TERMINALS
-
 		existing = [
 			'windowsterminal', 'cmd', 'powershell', 'pwsh', 'conhost',
 			'cmder', 'conemu', 'conemu64', 'mintty', 'putty', 'kitty',
@@ -189,38 +203,34 @@ class TestSupportedTerminals(unittest.TestCase):
 
 	def test_total_terminal_count(self):
 		"""Total supported terminal count should be 30 (20 original + 10 new)."""
-		from globalPlugins.terminalAccess import _SUPPORTED_TERMINALS
 		self.assertEqual(len(_SUPPORTED_TERMINALS), 30)
 
 
 class TestNewTerminalProfiles(unittest.TestCase):
 	"""Tests for profiles of new terminal emulators."""
 
-	def _get_manager(self):
-		from globalPlugins.terminalAccess import ProfileManager
-		return ProfileManager()
+	@classmethod
+	def setUpClass(cls):
+		"""One ProfileManager for the class; these tests only read profiles."""
+		cls.manager = ProfileManager()
 
 	def test_gpu_terminal_profiles_exist(self):
 		"""Each new GPU terminal should have a default profile."""
-		manager = self._get_manager()
 		for name in ['ghostty', 'rio', 'waveterm', 'contour', 'cool-retro-term']:
-			profile = manager.getProfile(name)
+			profile = self.manager.getProfile(name)
 			self.assertIsNotNone(profile, f"Profile for '{name}' should exist")
 
 	def test_professional_terminal_profiles_exist(self):
 		"""Each new professional terminal should have a default profile."""
-		manager = self._get_manager()
 		for name in ['mobaxterm', 'securecrt', 'ttermpro', 'mremoteng', 'royalts']:
-			profile = manager.getProfile(name)
+			profile = self.manager.getProfile(name)
 			self.assertIsNotNone(profile, f"Profile for '{name}' should exist")
 
 	def test_new_terminal_profiles_use_standard_tracking(self):
 		"""New terminal profiles should use CT_STANDARD cursor tracking."""
-		from globalPlugins.terminalAccess import CT_STANDARD
-		manager = self._get_manager()
 		for name in ['ghostty', 'rio', 'waveterm', 'contour', 'cool-retro-term',
 					  'mobaxterm', 'securecrt', 'ttermpro', 'mremoteng', 'royalts']:
-			profile = manager.getProfile(name)
+			profile = self.manager.getProfile(name)
 			self.assertEqual(profile.cursorTrackingMode, CT_STANDARD,
 				f"Profile '{name}' should use CT_STANDARD")
 
@@ -228,15 +238,14 @@ class TestNewTerminalProfiles(unittest.TestCase):
 class TestTUIProfiles(unittest.TestCase):
 	"""Tests for TUI application profiles."""
 
-	def _get_manager(self):
-		from globalPlugins.terminalAccess import ProfileManager
-		return ProfileManager()
+	@classmethod
+	def setUpClass(cls):
+		"""One ProfileManager for the class; these tests only read profiles."""
+		cls.manager = ProfileManager()
 
 	def test_claude_profile_exists(self):
 		"""Claude CLI profile should exist with expected settings."""
-		from globalPlugins.terminalAccess import PUNCT_MOST
-		manager = self._get_manager()
-		profile = manager.getProfile('claude')
+		profile = self.manager.getProfile('claude')
 		self.assertIsNotNone(profile)
 		self.assertEqual(profile.displayName, 'Claude CLI')
 		self.assertEqual(profile.punctuationLevel, PUNCT_MOST)
@@ -246,9 +255,7 @@ class TestTUIProfiles(unittest.TestCase):
 
 	def test_lazygit_profile_exists(self):
 		"""lazygit profile should exist with expected settings."""
-		from globalPlugins.terminalAccess import PUNCT_MOST, CT_WINDOW
-		manager = self._get_manager()
-		profile = manager.getProfile('lazygit')
+		profile = self.manager.getProfile('lazygit')
 		self.assertIsNotNone(profile)
 		self.assertEqual(profile.punctuationLevel, PUNCT_MOST)
 		self.assertFalse(profile.repeatedSymbols)
@@ -257,33 +264,28 @@ class TestTUIProfiles(unittest.TestCase):
 
 	def test_btop_btm_share_profile(self):
 		"""btm should map to the same profile as btop."""
-		manager = self._get_manager()
-		btop_profile = manager.getProfile('btop')
-		btm_profile = manager.getProfile('btm')
+		btop_profile = self.manager.getProfile('btop')
+		btm_profile = self.manager.getProfile('btm')
 		self.assertIsNotNone(btop_profile)
 		self.assertIsNotNone(btm_profile)
 		self.assertIs(btop_profile, btm_profile)
 
 	def test_yazi_profile_exists(self):
 		"""yazi profile should exist."""
-		manager = self._get_manager()
-		profile = manager.getProfile('yazi')
+		profile = self.manager.getProfile('yazi')
 		self.assertIsNotNone(profile)
 		self.assertFalse(profile.keyEcho)
 		self.assertFalse(profile.repeatedSymbols)
 
 	def test_k9s_profile_exists(self):
 		"""k9s profile should exist with expected settings."""
-		from globalPlugins.terminalAccess import PUNCT_MOST
-		manager = self._get_manager()
-		profile = manager.getProfile('k9s')
+		profile = self.manager.getProfile('k9s')
 		self.assertIsNotNone(profile)
 		self.assertEqual(profile.punctuationLevel, PUNCT_MOST)
 		self.assertFalse(profile.linePause)
 
 	def test_tui_profiles_in_builtin_names(self):
 		"""TUI profiles should be in _BUILTIN_PROFILE_NAMES (cannot be removed)."""
-		from globalPlugins.terminalAccess import _BUILTIN_PROFILE_NAMES
 		for name in ['claude', 'lazygit', 'btop', 'btm', 'yazi', 'k9s']:
 			self.assertIn(name, _BUILTIN_PROFILE_NAMES,
 				f"'{name}' should be in _BUILTIN_PROFILE_NAMES")
@@ -292,9 +294,10 @@ class TestTUIProfiles(unittest.TestCase):
 class TestTUIWindowTitleDetection(unittest.TestCase):
 	"""Tests for window title-based TUI application detection."""
 
-	def _get_manager(self):
-		from globalPlugins.terminalAccess import ProfileManager
-		return ProfileManager()
+	@classmethod
+	def setUpClass(cls):
+		"""One ProfileManager for the class; these tests only read profiles."""
+		cls.manager = ProfileManager()
 
 	def _make_focus(self, app_name='unknown', title=''):
 		"""Create a mock focus object with given app name and window title."""
@@ -305,45 +308,38 @@ class TestTUIWindowTitleDetection(unittest.TestCase):
 
 	def test_detect_claude_from_title(self):
 		"""Window title containing 'claude' should detect Claude CLI."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='claude - conversation')
-		self.assertEqual(manager.detectApplication(focus), 'claude')
+		self.assertEqual(self.manager.detectApplication(focus), 'claude')
 
 	def test_detect_lazygit_from_title(self):
 		"""Window title containing 'lazygit' should detect lazygit."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='lazygit: myrepo')
-		self.assertEqual(manager.detectApplication(focus), 'lazygit')
+		self.assertEqual(self.manager.detectApplication(focus), 'lazygit')
 
 	def test_detect_btop_from_title(self):
 		"""Window title containing 'btop' should detect btop."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='btop++')
-		self.assertEqual(manager.detectApplication(focus), 'btop')
+		self.assertEqual(self.manager.detectApplication(focus), 'btop')
 
 	def test_detect_btm_from_title(self):
 		"""Window title containing 'btm' should detect btop profile."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='btm - system monitor')
-		self.assertEqual(manager.detectApplication(focus), 'btop')
+		self.assertEqual(self.manager.detectApplication(focus), 'btop')
 
 	def test_detect_yazi_from_title(self):
 		"""Window title containing 'yazi' should detect yazi."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='yazi /home/user')
-		self.assertEqual(manager.detectApplication(focus), 'yazi')
+		self.assertEqual(self.manager.detectApplication(focus), 'yazi')
 
 	def test_detect_k9s_from_title(self):
 		"""Window title containing 'k9s' should detect k9s."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='k9s - default namespace')
-		self.assertEqual(manager.detectApplication(focus), 'k9s')
+		self.assertEqual(self.manager.detectApplication(focus), 'k9s')
 
 	def test_unknown_title_returns_default(self):
 		"""Unknown window title should return 'default'."""
-		manager = self._get_manager()
 		focus = self._make_focus(title='Some Random Application')
-		self.assertEqual(manager.detectApplication(focus), 'default')
+		self.assertEqual(self.manager.detectApplication(focus), 'default')
 
 
 if __name__ == '__main__':
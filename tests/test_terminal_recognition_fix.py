@@ -14,8 +14,7 @@ class TestTerminalRecognitionFix(unittest.TestCase):
 	def setUp(self):
 		"""Set up test fixtures."""
 		from globalPlugins.terminalAccess import GlobalPlugin
-		with patch('gui.settingsDialogs.NVDASettingsDialog'):
-			self.plugin = GlobalPlugin()
+		self.plugin = GlobalPlugin()
 
 	def test_isterminalapp_with_none_obj(self):
 		"""Test isTerminalApp with None object."""
@@ -0,0 +1,63 @@
+"""
+Tests for the TextDiffer class (incremental terminal output diffing).
+"""
+import unittest
+
+from globalPlugins.terminalAccess import TextDiffer
+
+
+# (name, successive update() inputs, expected result of the last update)
+_TEXT_DIFFER_CASES = (
+    ("first_update_is_initial", ("hello\nworld\n",),
+     (TextDiffer.KIND_INITIAL, "")),
+    ("identical_update_is_unchanged", ("hello\n", "hello\n"),
+     (TextDiffer.KIND_UNCHANGED, "")),
+    ("appended_text_detected", ("line1\nline2\n", "line1\nline2\nline3\n"),
+     (TextDiffer.KIND_APPENDED, "line3\n")),
+    ("non_trivial_change", ("original text", "completely different"),
+     (TextDiffer.KIND_CHANGED, "")),
+    ("first_of_successive_appends", ("a", "ab"),
+     (TextDiffer.KIND_APPENDED, "b")),
+    ("second_of_successive_appends", ("a", "ab", "abc"),
+     (TextDiffer.KIND_APPENDED, "c")),
+    # "" is a prefix of "new content", so detected as appended
+    ("empty_to_content", ("", "new content"),
+     (TextDiffer.KIND_APPENDED, "new content")),
+)
+
+
+class TestTextDiffer(unittest.TestCase):
+    """Tests for the TextDiffer class."""
+
+    def test_update_results(self):
+        for name, updates, expected in _TEXT_DIFFER_CASES:
+            with self.subTest(case=name):
+                td = TextDiffer()
+                for text in updates[:-1]:
+                    td.update(text)
+                self.assertEqual(td.update(updates[-1]), expected)
+
+    def test_reset_makes_next_update_initial(self):
+        td = TextDiffer()
+        td.update("some text")
+        td.reset()
+        kind, content = td.update("some text")
+        self.assertEqual(kind, TextDiffer.KIND_INITIAL)
+
+    def test_last_text_property(self):
+        td = TextDiffer()
+        self.assertIsNone(td.last_text)
+        td.update("abc")
+        self.assertEqual(td.last_text, "abc")
+        td.update("abcdef")
+        self.assertEqual(td.last_text, "abcdef")
+
+    def test_reset_clears_last_text(self):
+        td = TextDiffer()
+        td.update("text")
+        td.reset()
+        self.assertIsNone(td.last_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
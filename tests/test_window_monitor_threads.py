@@ -0,0 +1,85 @@
+"""
+Tests for WindowMonitor behaviour that needs real threads.
+
+The monitoring-loop tests in test_window_monitor.py drive _poll_once()
+from a manual clock.  The tests here start the background thread or race
+threads against each other, so the whole module is marked ``timing``.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import time
+import threading
+
+import pytest
+
+import lib._runtime as _rt
+from globalPlugins.terminalAccess import WindowMonitor
+
+pytestmark = pytest.mark.timing
+
+
+class TestWindowMonitorThreads(unittest.TestCase):
+	"""WindowMonitor tests that run on real background threads."""
+
+	def setUp(self):
+		"""Set up test fixtures."""
+		self.mock_terminal = Mock(content="Line 1\nLine 2\nLine 3")
+		self.mock_position_calculator = Mock()
+		self.monitor = WindowMonitor(self.mock_terminal, self.mock_position_calculator)
+
+	def tearDown(self):
+		"""Clean up after tests."""
+		if self.monitor and self.monitor.is_monitoring():
+			self.monitor.stop_monitoring()
+
+	@patch.object(_rt, 'read_terminal_text', side_effect=lambda terminal: terminal.content)
+	def test_monitoring_loop_starts_and_stops(self, mock_read):
+		"""Test that monitoring loop starts and stops cleanly."""
+		polled = threading.Event()
+
+		def sleep(seconds):
+			polled.set()
+			time.sleep(0.001)
+
+		self.monitor._sleep = sleep
+		self.monitor.add_monitor("test", (1, 1, 3, 80), interval_ms=100)
+		self.monitor.start_monitoring()
+
+		# Wait for the loop to complete at least one poll
+		self.assertTrue(polled.wait(timeout=2.0))
+
+		# Stop monitoring
+		self.monitor.stop_monitoring()
+
+		# Should stop cleanly
+		self.assertFalse(self.monitor.is_monitoring())
+
+	def test_thread_safety_add_remove(self):
+		"""Test thread safety of adding and removing monitors."""
+		def add_monitors():
+			for i in range(10):
+				self.monitor.add_monitor(f"window_{i}", (i + 1, 1, i + 10, 80))
+
+		def remove_monitors():
+			time.sleep(0.01)  # Small delay
+			for i in range(10):
+				self.monitor.remove_monitor(f"window_{i}")
+
+		# Run add and remove in parallel threads
+		thread1 = threading.Thread(target=add_monitors)
+		thread2 = threading.Thread(target=remove_monitors)
+
+		thread1.start()
+		thread2.start()
+
+		thread1.join()
+		thread2.join()
+
+		# Should not crash - check monitor count
+		status = self.monitor.get_monitor_status()
+		self.assertIsInstance(status, list)  # Should be a list (might be empty)
+
+
+if __name__ == '__main__':
+	unittest.main()